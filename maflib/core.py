@@ -30,21 +30,37 @@ This module contains the core functionality of maf that handles parameterized
 tasks and metanodes.
 """
 
+import ast
 import collections
+import contextlib
 import copy
+import fcntl
 import os
 import os.path
 import types
 import inspect
+import multiprocessing
+import multiprocessing.pool
 import re
+import shutil
+import struct
 import tempfile
+import textwrap
+import threading
+import traceback
 import subprocess
+import sys
+import weakref
+import sqlite3
 try:
     import cPickle as pickle
 except ImportError:
     import pickle
 
 import waflib.Build
+import waflib.ConfigSet
+import waflib.Logs
+import waflib.Node
 import waflib.Utils
 import waflib.Options
 from waflib.TaskGen import before_method, feature
@@ -96,21 +112,121 @@ class ExperimentContext(waflib.Build.BuildContext):
             table_path, table_path + '.tsv')
         self._nodes = collections.defaultdict(set)
 
+        for call_object in call_objects:
+            self._set_rule_and_dependson(call_object)
+
+        self._generated_tasks = {}
+        self._link_template = {
+            'rule': _link_outputs, 'features': ['experiment'],
+            'dependson': []}
+
+        # The manifest is saved after the tasks run (see compile).
+        self._directory_manifest = DirectoryManifest(
+            os.path.join(self.variant_dir, '.maf_dir_manifest'))
+        self._expand_call_objects(call_objects, table_path)
+
+    def _expand_call_objects(self, call_objects, table_path):
+        # Physical tasks expanded in the previous build are reused if the
+        # experiment graph and the id table are not changed.
+        graph_cache = ExpandedGraphCache(
+            os.path.join(self.variant_dir, '.maf_graph_cache'), table_path)
+        if not getattr(waflib.Options.options, 'no_graph_cache', False):
+            physical_tasks = graph_cache.load(call_objects)
+            if physical_tasks is not None:
+                self._physical_tasks = None
+                for call_object, tasks in zip(call_objects, physical_tasks):
+                    template = self._create_task_gen_template(call_object)
+                    for task in tasks:
+                        self._call_super(template, *task)
+                return
+
+        self._physical_tasks = []
         try:
             for call_object in call_objects:
+                self._physical_tasks.append([])
                 self._process_call_object(call_object)
         finally:
             self._parameter_id_generator.save()
 
+        graph_cache.save(call_objects, self._physical_tasks)
+        self._physical_tasks = None
+
+    def compile(self):
+        """
+        See :py:func:`waflib.Build.BuildContext.compile`.
+        """
+        self._signature_cache = SignatureCache(
+            os.path.join(self.variant_dir, '.maf_sig_cache'),
+            getattr(waflib.Options.options, 'trust_stat', False))
+        for pool in _worker_pools:
+            pool.start()
+
+        path = _build_cache_dir()
+        self.build_cache = None
+        """Cache of outputs of tasks shared by builds, or None if disabled."""
+        if path:
+            max_size = getattr(
+                waflib.Options.options, 'build_cache_size', None) or 10240
+            self.build_cache = BuildCache(path, max_size << 20)
+
+        try:
+            super(ExperimentContext, self).compile()
+        finally:
+            self._signature_cache.save()
+            manifest = getattr(self, '_directory_manifest', None)
+            if manifest is not None:
+                manifest.save()
+            if self.build_cache:
+                self.build_cache.evict()
+
+    def get_build_iterator(self):
+        """
+        See :py:func:`waflib.Build.BuildContext.get_build_iterator`.
+
+        Signatures of input files of each group of tasks are computed in
+        parallel before the tasks are scheduled.
+        """
+        for tasks in super(ExperimentContext, self).get_build_iterator():
+            if tasks:
+                self._prefetch_signatures(tasks)
+            yield tasks
+
+    def _prefetch_signatures(self, tasks):
+        cache = getattr(self, '_signature_cache', None)
+        if cache is None:
+            return
+
+        # Only source files are prefetched, since files in the build directory
+        # may be changed by tasks in the group. Node objects are not thread-
+        # safe, so paths are collected here and only hashing is parallelized.
+        paths = set()
+        for task in tasks:
+            if not isinstance(task, ExperimentTask):
+                continue
+            for node in task.inputs + getattr(task, 'dep_nodes', []):
+                if not isinstance(node, waflib.Node.Node) or node.is_bld():
+                    continue
+                path = node.abspath()
+                if os.path.isdir(path):
+                    for dirpath, _, filenames in os.walk(path):
+                        for filename in filenames:
+                            paths.add(os.path.join(dirpath, filename))
+                elif os.path.isfile(path):
+                    paths.add(path)
+
+        jobs = getattr(waflib.Options.options, 'hash_jobs', None) or self.jobs
+        cache.prefetch(paths, jobs)
+
     def _process_call_object(self, call_object):
-        self._set_rule_and_dependson(call_object)
+        template = self._create_task_gen_template(call_object)
 
         if hasattr(call_object, 'for_each'):
-            self._generate_aggregation_tasks(call_object, 'for_each')
+            self._generate_aggregation_tasks(call_object, template, 'for_each')
         elif hasattr(call_object, 'aggregate_by'):
-            self._generate_aggregation_tasks(call_object, 'aggregate_by')
+            self._generate_aggregation_tasks(
+                call_object, template, 'aggregate_by')
         else:
-            self._generate_tasks(call_object)
+            self._generate_tasks(call_object, template)
 
     def _set_rule_and_dependson(self, call_object):
         # dependson attribute is a variable or a function, changes of which
@@ -122,74 +238,97 @@ class ExperimentContext(waflib.Build.BuildContext):
             if not isinstance(rule, Rule):
                 rule = Rule(rule)
             rule.add_dependson(getattr(call_object, 'dependson', []))
-            call_object.rule = lambda task: rule.fun(task)
+            call_object.rule = _rule_runner(rule)
             call_object.dependson = rule.stred_dependson()
+            call_object.rule_digest = _rule_digest(rule.fun)
+            call_object.rule_key = call_object.rule_digest or \
+                _callable_key(rule.fun)
         else:
             call_object.dependson = []
-
-    def _generate_tasks(self, call_object):
-        if not call_object.rel_source:
-            for parameter in call_object.parameters:
-                self._generate_task(call_object, [], parameter)
-
-        parameter_lists = []
-
-        # Generate all valid list of parameters corresponding to source nodes.
+            call_object.rule_key = call_object.__dict__.get('rule')
+            call_object.rule_digest = ''
+
+    def _create_task_gen_template(self, call_object):
+        # Arguments of BuildContext.__call__ shared by all physical tasks of
+        # the call object. Each task only adds its own source and target, so we
+        # do not have to copy the call object for each task. Parameters and
+        # aggregation keys are only used for the graph expansion.
+        template = dict(call_object.__dict__)
+        for key in ['source', 'target', 'parameters', 'for_each',
+                    'aggregate_by', 'parameter_keys', 'rule_key']:
+            template.pop(key, None)
+
+        # Key of the behavior of tasks used to find duplicated tasks. It covers
+        # all arguments of the task generator (e.g. cwd, env or attributes
+        # read by the rule through task.generator) except for the nodes, the
+        # name and the wscript, and is removed from the arguments in
+        # _call_super. The rule itself is replaced by its digest, since the
+        # run method is created for each call object, so that the same rules
+        # written in different wscripts share the key.
+        rule_key = getattr(call_object, 'rule_key', None)
+        if rule_key is not None:
+            template['task_key'] = (rule_key, tuple(sorted(
+                (key, _attribute_key(value))
+                for key, value in template.iteritems()
+                if key not in _TASK_KEY_EXCLUDED_ATTRIBUTES)))
+        return template
+
+    def _generate_tasks(self, call_object, template):
+        # Generate all valid lists of parameters corresponding to source nodes,
+        # each of which is followed by a task-gen parameter.
+        relations = []
         for node in call_object.rel_source:
             node_params = self._nodes[node]
             if not node_params:
                 # node is physical. We use empty parameter as a dummy.
-                node_params = [Parameter()]
-
-            if not parameter_lists:
-                for node_param in node_params:
-                    parameter_lists.append([node_param])
-                continue
-
-            new_lists = []
-            for node_param in node_params:
-                for parameter_list in parameter_lists:
-                    if any(p.conflict_with(node_param) for p in parameter_list):
-                        continue
-                    new_list = list(parameter_list)
-                    new_list.append(node_param)
-                    new_lists.append(new_list)
-
-            parameter_lists = new_lists
-
-        for parameter_list in parameter_lists:
-            for parameter in call_object.parameters:
-                if any(p.conflict_with(parameter) for p in parameter_list):
+                node_params = [FrozenParameter.intern()]
+            relations.append(node_params)
+        relations.append(call_object.parameters)
+
+        # Task-gen parameters are projected to the keys used by the task after
+        # the join, so that they still select the source parameters. Tasks
+        # that differ only in unused keys are generated only once.
+        parameter_keys = getattr(call_object, 'parameter_keys', None)
+        generated = set()
+        for parameter_list in _join_parameters(relations):
+            source_parameter = parameter_list[:-1]
+            parameter = parameter_list[-1]
+            if parameter_keys is not None:
+                parameter = FrozenParameter.intern(
+                    [(k, v) for k, v in parameter.iteritems()
+                     if k in parameter_keys])
+                key = (tuple(source_parameter), parameter)
+                if key in generated:
                     continue
-                self._generate_task(call_object, parameter_list, parameter)
+                generated.add(key)
+            self._generate_task(
+                call_object, template, source_parameter, parameter)
 
-    def _generate_task(self, call_object, source_parameter, parameter):
+    def _generate_task(self, call_object, template, source_parameter,
+                       parameter):
         # Create target parameter by merging source parameter and task-gen
         # parameter.
-        target_parameter = Parameter()
+        target_parameter = {}
         for p in source_parameter:
             target_parameter.update(p)
         target_parameter.update(parameter)
+        target_parameter = FrozenParameter.intern(target_parameter)
 
         for node in call_object.rel_target:
             self._nodes[node].add(target_parameter)
 
         # Convert source/target meta nodes to physical nodes.
-        physical_source = self._resolve_meta_nodes(
-            call_object.rel_source, source_parameter)
-        physical_target = self._resolve_meta_nodes(
-            call_object.rel_target, target_parameter)
-
-        # Create arguments of BuildContext.__call__.
-        physical_call_object = copy.deepcopy(call_object)
-        physical_call_object.source = physical_source
-        physical_call_object.target = physical_target
-        del physical_call_object.parameters
+        physical_source = [
+            self._resolve_meta_node(node, parameter)
+            for node, parameter in zip(call_object.rel_source, source_parameter)]
+        physical_target = [
+            self._resolve_meta_node(node, target_parameter)
+            for node in call_object.rel_target]
 
-        self._call_super(
-            physical_call_object, source_parameter, target_parameter)
+        self._call_super(template, physical_source, physical_target,
+                         source_parameter, target_parameter)
 
-    def _generate_aggregation_tasks(self, call_object, key_type):
+    def _generate_aggregation_tasks(self, call_object, template, key_type):
         # In aggregation tasks, source and target must be only one (meta) node.
         # Source node must be meta node. Whether target node is meta or not is
         # automatically decided by source parameters and for_each/aggregate_by
@@ -209,7 +348,7 @@ class ExperimentContext(waflib.Build.BuildContext):
         target_to_source = collections.defaultdict(list)
 
         for source_parameter in source_parameters:
-            target_parameter = Parameter()
+            target_parameter = {}
             if key_type == 'for_each':
                 for key in call_object.for_each:
                     target_parameter[key] = source_parameter[key]
@@ -217,6 +356,7 @@ class ExperimentContext(waflib.Build.BuildContext):
                 for key in source_parameter:
                     if key not in call_object.aggregate_by:
                         target_parameter[key] = source_parameter[key]
+            target_parameter = FrozenParameter.intern(target_parameter)
             target_to_source[target_parameter].append(source_parameter)
 
         for target_parameter in target_to_source:
@@ -227,51 +367,67 @@ class ExperimentContext(waflib.Build.BuildContext):
 
             self._nodes[target_node].add(target_parameter)
 
-            # Create arguments of BuildContext.__call__.
-            physical_call_object = copy.deepcopy(call_object)
-            physical_call_object.source = source
-            physical_call_object.target = target
-            if key_type == 'for_each':
-                del physical_call_object.for_each
-            else:
-                del physical_call_object.aggregate_by
-
-            self._call_super(
-                physical_call_object, source_parameter, target_parameter)
-
-    def _call_super(self, call_object, source_parameter, target_parameter):
-        taskgen = super(ExperimentContext, self).__call__(
-            **call_object.__dict__)
+            self._call_super(template, source, target,
+                             source_parameter, target_parameter)
+
+    def _call_super(self, template, source, target, source_parameter,
+                    target_parameter):
+        # source and target are paths of physical nodes (or a list of them)
+        # given by _resolve_meta_node.
+        if self._physical_tasks is not None:
+            self._physical_tasks[-1].append(
+                (source, target, source_parameter, target_parameter))
+
+        # A task with the same rule, the same physical sources and the same
+        # parameter as a task generated before only links the outputs of that
+        # task to its targets.
+        task_key = template.get('task_key')
+        if task_key is not None and \
+           not getattr(waflib.Options.options, 'no_task_dedup', False):
+            targets = _to_list(target)
+            task_key += (tuple(_to_list(source)), target_parameter,
+                         len(targets))
+            original_targets = self._generated_tasks.setdefault(
+                task_key, targets)
+            if original_targets != targets:
+                template = self._link_template
+                source = original_targets
+
+        # Create arguments of BuildContext.__call__. Lists in the template
+        # (e.g. features) are copied since task generators may modify them.
+        kw = dict(template)
+        kw.pop('task_key', None)
+        for key, value in template.iteritems():
+            if isinstance(value, list):
+                kw[key] = list(value)
+        kw['source'] = self._find_physical_nodes(source)
+        kw['target'] = self._find_physical_nodes(target)
+
+        taskgen = super(ExperimentContext, self).__call__(**kw)
         taskgen.env.source_parameter = source_parameter  # for backward compatibility
         taskgen.env.update(target_parameter.to_str_valued_dict())
 
-        depkeys = [('dependson%d' % i) for i in range(len(call_object.dependson))]
-        taskgen.env.update(dict(zip(depkeys, call_object.dependson)))
+        dependson = template['dependson']
+        depkeys = [('dependson%d' % i) for i in range(len(dependson))]
+        taskgen.env.update(dict(zip(depkeys, dependson)))
 
         taskgen.parameter = target_parameter
         taskgen.source_parameter = source_parameter
 
-    def _resolve_meta_nodes(self, nodes, parameters):
-        if not isinstance(parameters, list):
-            parameters = [parameters] * len(nodes)
-
-        physical_nodes = []
-        for node, parameter in zip(nodes, parameters):
-            physical_nodes.append(self._resolve_meta_node(node, parameter))
-        return physical_nodes
-
     def _resolve_meta_node(self, node, parameter):
-        def _not_deleted_any_files_in(n):
-            children = getattr(n, 'children', {})
-            if not children:
-                return os.path.exists(n.abspath())
-            else:
-                return all([_not_deleted_any_files_in(c) for c in n.children.values()])
-                    
+        # Returns the path of the physical node corresponding to the parameter.
         if parameter:
             parameter_id = self._parameter_id_generator.get_id(parameter)
             node = os.path.join(
                 node, '-'.join([parameter_id, os.path.basename(node)]))
+        return node
+
+    def _find_physical_nodes(self, nodes):
+        if isinstance(nodes, list):
+            return [self._find_physical_node(node) for node in nodes]
+        return self._find_physical_node(nodes)
+
+    def _find_physical_node(self, node):
         if node[0] == '/':
             # find_node can find directories (compared to find_resource, which can only find files)
             return self.root.find_node(node) 
@@ -290,8 +446,8 @@ class ExperimentContext(waflib.Build.BuildContext):
 
         # search_node doesn't look on filesystem, so cannot detect manual changes on
         # the directory; e.g., sometimes one may delete an output directory or figure
-        # manually. `_not_deleted_any_files_in` check the consistency on the filesystem.
-        if existing_dir_node and _not_deleted_any_files_in(existing_dir_node):
+        # manually. `DirectoryManifest` check the consistency on the filesystem.
+        if existing_dir_node and self._directory_manifest.check(existing_dir_node):
             return existing_dir_node
         else:
             return self.path.find_or_declare(node)
@@ -573,6 +729,31 @@ class ExpOptionsContext(waflib.Options.OptionsContext):
                       help = 'path to the output of graph [default: %s]' % default_path)
         gr.add_option('--simple_param', action = 'store_true', default = False,
                       help = 'outputs parameter ids instead of specific values')
+
+        ex = self.add_option_group('experiment options')
+        ex.add_option('--no_graph_cache', action = 'store_true', default = False,
+                      help = 'expands the experiment graph without the cache of the previous build')
+        ex.add_option('--trust_stat', action = 'store_true', default = False,
+                      help = 'reuses signatures of files whose inode, size and mtime are not changed')
+        ex.add_option('--hash_jobs', action = 'store', type = 'int', default = 0,
+                      help = 'number of threads to hash input files [default: same as --jobs]')
+        ex.add_option('--build_cache', action = 'store', default = None,
+                      help = 'directory of the cache of task outputs shared by builds, or empty to disable it '
+                             '[default: $MAF_BUILD_CACHE or disabled]')
+        ex.add_option('--build_cache_size', action = 'store', type = 'int', default = 10240,
+                      help = 'maximum size of the build cache in megabytes [default: 10240]')
+        ex.add_option('--no_task_dedup', action = 'store_true', default = False,
+                      help = 'runs tasks that have the same rule, sources and parameter as another task '
+                             'instead of linking the outputs of that task')
+        ex.add_option('--process_rules', action = 'store_true', default = False,
+                      help = 'runs all Python rules in worker processes')
+        ex.add_option('--rule_jobs', action = 'store', type = 'int', default = 0,
+                      help = 'number of processes to run Python rules [default: same as --jobs]')
+        ex.add_option('--plot_jobs', action = 'store', type = 'int', default = 1,
+                      help = 'number of processes to render figures of plot_by, or 0 to use --jobs [default: 1]')
+        ex.add_option('--download_cache', action = 'store', default = None,
+                      help = 'directory to cache downloaded files in, or empty to disable the cache '
+                             '[default: $MAF_DOWNLOAD_CACHE, or disabled]')
         
         
 class CyclicDependencyException(Exception):
@@ -591,11 +772,13 @@ class Parameter(dict):
     """Parameter of maf task.
 
     This is a dict with hash(). Be careful to use it with set(); parameter has
-    hash(), but is mutable.
+    hash(), but is mutable. Use :py:class:`FrozenParameter` for a parameter
+    used as a key of sets and dictionaries many times.
 
     """
     def __hash__(self):
-        # TODO(beam2d): Should we cache this value?
+        # The hash value cannot be cached since parameter is mutable. See
+        # FrozenParameter for the cached version.
         return hash(frozenset(self.iteritems()))
 
     def conflict_with(self, parameter):
@@ -619,6 +802,63 @@ class Parameter(dict):
         return dict([(k, str(self[k])) for k in self])
 
 
+class FrozenParameter(Parameter):
+    """Immutable parameter of maf task.
+
+    The hash value is calculated only once at the construction. Experiment
+    graph expansion hashes same parameters again and again (e.g. on joining
+    source nodes, aggregating them and generating ids of them), so
+    :py:class:`ExperimentContext` uses this class instead of
+    :py:class:`Parameter` for all parameters of meta nodes.
+
+    A frozen parameter is equal to and has the same hash value as the
+    :py:class:`Parameter` with the same items, so they can be used
+    interchangeably as keys of sets and dictionaries.
+
+    """
+    _interned = weakref.WeakValueDictionary()
+
+    def __init__(self, *args, **kw):
+        super(FrozenParameter, self).__init__(*args, **kw)
+        self._hash = hash(frozenset(self.iteritems()))
+
+    @classmethod
+    def intern(cls, *args, **kw):
+        """Gets the frozen parameter equal to given items.
+
+        Equal parameters created through this method are shared as one
+        instance while it is alive, which saves both memory and the cost of
+        equality checks.
+
+        :return: Frozen parameter with given items. Arguments are same as those
+            of ``dict``.
+        :rtype: :py:class:`FrozenParameter`
+
+        """
+        if len(args) == 1 and not kw and isinstance(args[0], cls):
+            parameter = args[0]
+        else:
+            parameter = cls(*args, **kw)
+        return cls._interned.setdefault(parameter, parameter)
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def _immutable(self, *args, **kw):
+        raise TypeError("'%s' object is immutable" % self.__class__.__name__)
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+
 class Rule(object):
     """A wrapper object of a rule function with associate values,
     which change is tracked on the experiment.
@@ -628,22 +868,43 @@ class Rule(object):
         All these variables are later converted to string values, so if
         one wants to pass the variable of user-defined class, that class
         must provide meaningful `__str__` method.
+    :param process_pool: If True, the function is run in a worker process
+        instead of a thread of waf, so that CPU-bound rules are not serialized
+        by the GIL. ``--process_rules`` option enables it for all rules. The
+        number of worker processes is given by ``--rule_jobs`` (or ``--jobs``
+        if omitted), and the function is run in the thread if it is one. The
+        task passed to the function in a worker process is a copy that only
+        has ``inputs``, ``outputs`` (as :py:class:`ExperimentNode` objects),
+        ``parameter``, ``source_parameters`` and ``env``, and changes of it are
+        not reflected to the original task.
 
     """
 
-    def __init__(self, fun, dependson=[]):
+    def __init__(self, fun, dependson=None, process_pool=False):
         self.fun = fun
-        self.dependson = dependson
+        self.dependson = list(dependson or [])
         self.dependson.append(self.fun)
+        self.process_pool = process_pool
 
     def add_dependson(self, dependson):
         self.dependson += dependson
 
     def stred_dependson(self):
+        """Converts the tracked values into strings stored in the task env.
+
+        A callable object is converted to the fingerprint of its source code
+        (see :py:func:`_callable_fingerprint`), so formatting-only edits of a
+        rule do not invalidate the tasks. Other values are converted by
+        ``str``.
+
+        :return: List of strings, each of which corresponds to an element of
+            ``dependson``.
+        :rtype: ``list`` of ``str``
+
+        """
         def to_str(d):
-            # Callable object is converted to its source code as str.
             if _is_callable(d):
-                return inspect.getsource(d)
+                return _callable_fingerprint(d)
             else:
                 return str(d)
         return map(to_str, self.dependson)
@@ -672,10 +933,16 @@ class CallObject(object):
 
         self.__dict__['features'].append('experiment')
         if 'parameters' not in self.__dict__:
-            self.parameters = [Parameter()]
+            self.parameters = [FrozenParameter.intern()]
             """List of parameters indicated by the taskgen call."""
         else:
-            self.parameters = [Parameter(p) for p in self.parameters]
+            self.parameters = [
+                FrozenParameter.intern(p) for p in self.parameters]
+
+        if 'parameter_keys' in self.__dict__:
+            self.parameter_keys = _resolve_parameter_keys(
+                self.parameter_keys, self.__dict__.get('rule'))
+            """Keys of parameters that the task uses, or None if all."""
 
         # Some tests do not support the argument 'wscript'
         if 'wscript' in kw:
@@ -765,10 +1032,22 @@ class ParameterIdGenerator(object):
     consistent over multiple execution of waf, so we serializes the table to
     hidden file.
 
+    The table is stored in an SQLite database, each row of which consists of an
+    identifier, the digest and the pickled dictionary of the correspondent
+    parameter. The generator only looks up parameters used in the current
+    build by their digests, and save() only appends newly generated
+    identifiers in one transaction, so that the table is not corrupted by an
+    interrupted save. A table written by older maf (a pickled list of
+    dictionaries) is converted on the first access.
+
+    The digest is calculated from the pickled items of the parameter (see
+    :py:func:`_parameter_digest`) instead of the builtin ``hash()``, which
+    depends on the hash seed (e.g. ``PYTHONHASHSEED``) of the process.
+
     This class also dumps the correspondence to a human-readable text file.
     The file is tab-separated line for each correspondence: the first element
     is an identifier and the second is a JSON representation of the
-    correspondent parameter.
+    correspondent parameter. New correspondences are appended to the file.
 
     NOTE: On exception raised during task generation, save() must be called
     to avoid inconsistency on node names that had been generated before the
@@ -785,52 +1064,126 @@ class ParameterIdGenerator(object):
         :type text_path: str
 
         """
-        # TODO(beam2d): Isolate persistency support from resolver.
-
         self.path = path
         """Path to file that the table is serialized to."""
 
         self.text_path = text_path
         """Path to file that the table is dumped to as a human-readable text."""
 
+        self._table = {} # Parameter -> id
+        self._parameters = {} # id -> Parameter
+        self._new_ids = []
+
+        self._db = None
+        self._num_ids = 0
         if os.path.exists(path):
-            self._parameters, self._table = self._load_table(path)
-        else:
-            self._parameters = []
-            self._table = {} # Parameter -> id
+            self._num_ids = self._connection().execute(
+                'SELECT COUNT(*) FROM parameters').fetchone()[0]
 
     def save(self):
-        """Serializes the table to the file at self.path."""
-
-        if len(self._table) == 0: return
+        """Appends newly generated identifiers to the file at self.path, and
+        closes the connection to the table. The table is opened again if it is
+        needed after that.
 
-        with _create_file(self.path) as f:
-            # We only save a modified `self._parameters`, which is obtained by converting
-            # each element of `self._parameters` into a dictionary object.
-            # This is for deserializing parameter->id mappings outside without
-            # maflib and waflib dependencies. Parameter class is defined in maflib,
-            # so user cannot decode original objects without maflib libraries.
-            dicted_params = [dict(param) for param in self._parameters]
-            
-            pickle.dump(dicted_params, f)
-
-        with _create_file(self.text_path) as f:
-            for id, parameter in enumerate(self._parameters):
-                f.write('%s\t%s\n' % (id, parameter))
-
-    def _load_table(self, path):
+        """
+        try:
+            self._save()
+        finally:
+            self.close()
+
+    def close(self):
+        """Closes the connection to the table without saving."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _save(self):
+        if not self._new_ids: return
+
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+        db = self._connection(create=True)
+
+        rows = [(int(i), _parameter_digest(self._parameters[i]),
+                 _pickle_parameter(self._parameters[i]))
+                for i in self._new_ids]
+        with db:
+            db.executemany(
+                'INSERT INTO parameters VALUES (?, ?, ?)', rows)
+
+        if os.path.exists(self.text_path):
+            with open(self.text_path, 'a') as f:
+                for i in self._new_ids:
+                    f.write('%s\t%s\n' % (i, self._parameters[i]))
+        else:
+            # The text file is missing (e.g. the table was converted from the
+            # old format or the file was removed), so dump whole table.
+            with _atomic_create_file(self.text_path) as f:
+                for i, pickled in db.execute(
+                        'SELECT id, parameter FROM parameters ORDER BY id'):
+                    f.write('%s\t%s\n' % (i, _unpickle_parameter(pickled)))
+
+        self._new_ids = []
+
+    def _connection(self, create=False):
+        # Returns the connection to the table, or None if the table does not
+        # exist and create is False.
+        if self._db is None and (create or os.path.exists(self.path)):
+            self._db = self._open_table(self.path)
+        return self._db
+
+    def _open_table(self, path):
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                is_db = f.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+            if not is_db:
+                self._convert_pickled_table(path)
+
+        db = sqlite3.connect(path)
+        db.execute('CREATE TABLE IF NOT EXISTS parameters '
+                   '(id INTEGER PRIMARY KEY, hash INTEGER, parameter BLOB)')
+        db.execute('CREATE INDEX IF NOT EXISTS parameters_hash '
+                   'ON parameters (hash)')
+
+        # Tables written by older maf store the builtin hash values, which
+        # are replaced by digests.
+        if db.execute('PRAGMA user_version').fetchone()[0] < _TABLE_VERSION:
+            rows = [(_parameter_digest(_unpickle_parameter(pickled)), i)
+                    for i, pickled in db.execute(
+                        'SELECT id, parameter FROM parameters')]
+            with db:
+                db.executemany(
+                    'UPDATE parameters SET hash = ? WHERE id = ?', rows)
+                db.execute('PRAGMA user_version = %d' % _TABLE_VERSION)
+        return db
+
+    def _convert_pickled_table(self, path):
         dicted_params = []
         try:
-            with open(path) as f:
+            with open(path, 'rb') as f:
                 dicted_params = pickle.load(f)
         except EOFError: pass
 
-        parameters = [Parameter(param) for param in dicted_params]
-        table = {}
-        for i, param in enumerate(parameters):
-            if param is not None: table[param] = str(i)
-
-        return (parameters, table)
+        # Creates the new table aside and replaces the old one by rename, so
+        # that the old table remains on failure.
+        tmp_path = path + '.tmp'
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        db = sqlite3.connect(tmp_path)
+        try:
+            db.execute('CREATE TABLE parameters '
+                       '(id INTEGER PRIMARY KEY, hash INTEGER, parameter BLOB)')
+            rows = []
+            for i, param in enumerate(dicted_params):
+                param = FrozenParameter(param)
+                rows.append(
+                    (i, _parameter_digest(param), _pickle_parameter(param)))
+            with db:
+                db.executemany('INSERT INTO parameters VALUES (?, ?, ?)', rows)
+        finally:
+            db.close()
+        os.rename(tmp_path, path)
 
     def get_id(self, parameter):
         """Gets the id of given parameter.
@@ -845,10 +1198,19 @@ class ParameterIdGenerator(object):
         if parameter in self._table:
             return self._table[parameter]
 
-        new_id = str(len(self._parameters))
-        self._table[parameter] = new_id
-        self._parameters.append(parameter)
-
+        parameter = FrozenParameter.intern(parameter)
+        db = self._connection()
+        if db is not None:
+            rows = db.execute(
+                'SELECT id, parameter FROM parameters WHERE hash = ?',
+                (_parameter_digest(parameter),))
+            for i, pickled in rows:
+                if _unpickle_parameter(pickled) == parameter:
+                    return self._add(str(i), parameter)
+
+        new_id = self._add(str(self._num_ids), parameter)
+        self._num_ids += 1
+        self._new_ids.append(new_id)
         return new_id
 
     def get(self, parameter_id):
@@ -860,7 +1222,360 @@ class ParameterIdGenerator(object):
         :rtype: :py:class:`Parameter`
 
         """
-        return self._parameters[parameter_id]
+        parameter_id = str(parameter_id)
+        if parameter_id in self._parameters:
+            return self._parameters[parameter_id]
+
+        row = None
+        db = self._connection()
+        if db is not None:
+            row = db.execute(
+                'SELECT parameter FROM parameters WHERE id = ?',
+                (int(parameter_id),)).fetchone()
+        if row is None:
+            raise KeyError(parameter_id)
+        parameter = FrozenParameter.intern(_unpickle_parameter(row[0]))
+        self._add(parameter_id, parameter)
+        return parameter
+
+    def _add(self, parameter_id, parameter):
+        self._table[parameter] = parameter_id
+        self._parameters[parameter_id] = parameter
+        return parameter_id
+
+
+_SQLITE_HEADER = 'SQLite format 3\x00'
+
+# Version of the parameter table stored as user_version of the database.
+_TABLE_VERSION = 2
+
+
+def _pickle_parameter(parameter):
+    # Parameters are stored as plain dictionaries, so that the table can be
+    # decoded outside without maflib and waflib dependencies.
+    return sqlite3.Binary(
+        pickle.dumps(dict(parameter), pickle.HIGHEST_PROTOCOL))
+
+
+def _unpickle_parameter(pickled):
+    return FrozenParameter(pickle.loads(str(pickled)))
+
+
+def _parameter_digest(parameter):
+    # Digest of a parameter independent of the hash seed, used to look up the
+    # parameter table. Dictionaries and sets, whose orders depend on the hash
+    # seed, are sorted before pickling. Equal parameters that still have
+    # different digests (e.g. objects holding dictionaries) only get new ids.
+    items = sorted(
+        pickle.dumps(_canonical_value(item), pickle.HIGHEST_PROTOCOL)
+        for item in parameter.iteritems())
+    digest = waflib.Utils.md5(''.join(items)).digest()
+    return struct.unpack('<q', digest[:8])[0]
+
+
+def _canonical_value(value):
+    # Values equal to each other (e.g. 1, 1.0 and True, or 'a' and u'a') are
+    # converted to the same value, as FrozenParameter compares them as equal.
+    if type(value) in (int, long, bool):
+        return int(value)
+    if isinstance(value, float):
+        if value.is_integer():
+            return int(value)
+        return value
+    if isinstance(value, unicode):
+        try:
+            return value.encode('ascii')
+        except UnicodeEncodeError:
+            return value
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted(
+            (_canonical_value(k), _canonical_value(v))
+            for k, v in value.iteritems())))
+    if isinstance(value, (set, frozenset)):
+        return ('set', tuple(sorted(_canonical_value(v) for v in value)))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,
+                tuple(_canonical_value(v) for v in value))
+    return value
+
+
+class ExpandedGraphCache(object):
+    """Persistent cache of physical tasks expanded from the experiment graph.
+
+    Expansion of the experiment graph (joins of parameters, aggregations and
+    resolution of meta nodes) is run on every build, even if nothing is
+    changed. This class stores the physical tasks expanded from call objects,
+    i.e. paths of source/target nodes and parameters of each task, to the file,
+    and loads them on the next build instead of expanding the graph again.
+
+    The cache is keyed on the graph-related part of the call objects (nodes,
+    parameters, aggregation keys and dependson strings) and on the state of the
+    parameter id table. Rules themselves are not cached, since they are given
+    by the call objects of each build.
+
+    """
+    _version = 1
+
+    def __init__(self, path, table_path):
+        """Initializes the cache.
+
+        :param path: Path to the cache file.
+        :type path: str
+        :param table_path: Path to the persistent file of
+            :py:class:`ParameterIdGenerator`. The cache is invalidated when this
+            file is changed.
+        :type table_path: str
+
+        """
+        self.path = path
+        """Path to the cache file."""
+
+        self.table_path = table_path
+        """Path to the file of parameter id table."""
+
+    def load(self, call_objects):
+        """Loads physical tasks expanded from given call objects.
+
+        :param call_objects: Topologically sorted call objects.
+        :type call_objects: ``list`` of :py:class:`CallObject`
+        :return: List of physical tasks for each call object, or None if the
+            cache is not available. Each physical task is a tuple of source
+            path(s), target path(s), source parameters and target parameter.
+        :rtype: ``list`` of ``list`` of ``tuple``
+
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception:
+            return None
+
+        if cache.get('key') != self._key(call_objects):
+            return None
+        return cache['tasks']
+
+    def save(self, call_objects, physical_tasks):
+        """Saves physical tasks expanded from given call objects.
+
+        :param call_objects: Topologically sorted call objects.
+        :type call_objects: ``list`` of :py:class:`CallObject`
+        :param physical_tasks: Physical tasks in the format of :py:meth:`load`.
+        :type physical_tasks: ``list`` of ``list`` of ``tuple``
+
+        """
+        cache = {'key': self._key(call_objects), 'tasks': physical_tasks}
+        try:
+            with _atomic_create_file(self.path, 'wb') as f:
+                pickle.dump(cache, f, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Some parameters cannot be pickled; the graph is just expanded
+            # again on the next build.
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _key(self, call_objects):
+        m = waflib.Utils.md5()
+        m.update(repr(self._version))
+        try:
+            st = os.stat(self.table_path)
+            m.update(repr((st.st_size, st.st_mtime)))
+        except OSError:
+            pass
+
+        for call_object in call_objects:
+            m.update(repr([
+                call_object.rel_source,
+                call_object.rel_target,
+                [sorted(p.iteritems()) for p in call_object.parameters],
+                getattr(call_object, 'for_each', None),
+                getattr(call_object, 'aggregate_by', None),
+                getattr(call_object, 'parameter_keys', None),
+                call_object.dependson]))
+        return m.digest()
+
+
+class SignatureCache(object):
+    """Persistent cache of signatures (hash values of contents) of files.
+
+    Each entry is keyed by the path of a file and holds the stat of the file
+    (inode, size and mtime) with its signature. The signature is reused without
+    reading the file only in the trust-stat mode and only if the stat is not
+    changed; otherwise the file is hashed again and the entry is updated. The
+    mode is opt-in since a file rewritten with same size within the resolution
+    of mtime cannot be detected.
+
+    """
+    def __init__(self, path, trust_stat=False):
+        """Initializes the cache.
+
+        :param path: Path to the persistent file of the cache.
+        :type path: str
+        :param trust_stat: If True, signatures of files with unchanged stat are
+            reused.
+        :type trust_stat: bool
+
+        """
+        self.path = path
+        """Path to the persistent file of the cache."""
+
+        self.trust_stat = trust_stat
+        """Flag to reuse signatures of files with unchanged stat."""
+
+        self._dirty = False
+        self._signatures = {}  # path -> signature, computed in this build
+        try:
+            with open(path, 'rb') as f:
+                self._table = pickle.load(f)  # path -> (stat, signature)
+        except Exception:
+            self._table = {}
+
+    def get(self, path):
+        """Gets the signature of the file.
+
+        :param path: Path to the file.
+        :type path: str
+        :return: Signature of the file.
+        :rtype: str
+
+        """
+        try:
+            return self._signatures[path]
+        except KeyError:
+            pass
+
+        st = os.stat(path)
+        # Python 2 does not provide st_mtime_ns; float mtime keeps sub-second
+        # resolution on most filesystems.
+        key = (st.st_ino, st.st_size, st.st_mtime)
+
+        entry = self._table.get(path)
+        if self.trust_stat and entry is not None and entry[0] == key:
+            return entry[1]
+
+        sig = waflib.Utils.h_file(path)
+        if entry != (key, sig):
+            self._table[path] = (key, sig)
+            self._dirty = True
+        self._signatures[path] = sig
+        return sig
+
+    def prefetch(self, paths, jobs):
+        """Computes signatures of files in parallel.
+
+        Following calls of :py:meth:`get` for these files return the computed
+        signatures. Hashing is I/O-bound and both reading files and md5 release
+        the GIL, so it is run by threads.
+
+        :param paths: Paths to files.
+        :type paths: iterable of str
+        :param jobs: Number of threads.
+        :type jobs: int
+
+        """
+        paths = [path for path in paths if path not in self._signatures]
+        jobs = min(jobs, len(paths))
+        if jobs <= 1:
+            for path in paths:
+                self.get(path)
+            return
+
+        pool = multiprocessing.pool.ThreadPool(jobs)
+        try:
+            pool.map(self.get, paths)
+        finally:
+            pool.close()
+            pool.join()
+
+    def save(self):
+        """Saves the cache to the file at self.path if it is modified."""
+        if not self._dirty:
+            return
+        with _atomic_create_file(self.path, 'wb') as f:
+            pickle.dump(self._table, f, pickle.HIGHEST_PROTOCOL)
+        self._dirty = False
+
+
+class DirectoryManifest(object):
+    """Persistent manifest of directory nodes used to check that no file under
+    a directory node is deleted or modified manually.
+
+    The manifest of a directory node is the listing of all entries under the
+    directory, each of which is the relative path and the stat (size, mtime and
+    inode) of the entry, collected in one walk. The manifests of directory nodes
+    checked in a build are recorded by :py:meth:`save` after the tasks run.
+
+    A directory node passes the check if its manifest is unchanged since the
+    last build. If the manifest is changed, the node fails the check, so that
+    waf declares the node again and recomputes its signature from the files.
+    A node without a recorded manifest (e.g. in the first build after the
+    directory is created) passes the check if all files known to the node tree
+    exist. Results are memoized, so a directory node used by many tasks is
+    checked once per build.
+
+    """
+    def __init__(self, path):
+        """Initializes the manifest.
+
+        :param path: Path to the persistent file of the manifest.
+        :type path: str
+
+        """
+        self.path = path
+        """Path to the persistent file of the manifest."""
+
+        self._checked = {}  # path -> result of check, computed in this build
+        try:
+            with open(path, 'rb') as f:
+                self._table = pickle.load(f)  # path -> manifest
+        except Exception:
+            self._table = {}
+
+    def check(self, node):
+        """Checks that no file under the node is deleted or modified.
+
+        :param node: Node of a file or a directory.
+        :type node: :py:class:`waflib.Node.Node`
+        :return: True if the node exists and files under it are not changed
+            since the last build.
+        :rtype: bool
+
+        """
+        path = node.abspath()
+        try:
+            return self._checked[path]
+        except KeyError:
+            pass
+
+        if path in self._table:
+            result = self._table[path] == _directory_manifest(path)
+        elif not getattr(node, 'children', None):
+            result = os.path.exists(path)
+        else:
+            result = _not_deleted_any_files_in(node)
+
+        self._checked[path] = result
+        return result
+
+    def save(self):
+        """Records the current manifests of the directory nodes checked in
+        this build, and saves them to the file at self.path if they are
+        modified.
+
+        """
+        dirty = False
+        for path in self._checked:
+            manifest = _directory_manifest(path) if os.path.isdir(path) else None
+            if self._table.get(path) != manifest:
+                dirty = True
+                if manifest is None:
+                    del self._table[path]
+                else:
+                    self._table[path] = manifest
+        self._checked = {}
+        if not dirty:
+            return
+        with _atomic_create_file(self.path, 'wb') as f:
+            pickle.dump(self._table, f, pickle.HIGHEST_PROTOCOL)
 
 
 class ExperimentTask(waflib.Task.Task):
@@ -892,8 +1607,9 @@ class ExperimentTask(waflib.Task.Task):
 
         super(ExperimentTask, self).__init__(env=env, generator=generator)
 
-        self.parameter = generator.parameter
-        """Parameter whose values are not stringized."""
+        self.parameter = Parameter(generator.parameter)
+        """Parameter whose values are not stringized. It is a mutable copy of
+        the frozen parameter of the task generator, so rules can update it."""
 
         self.source_parameters = generator.source_parameter
         """List of parameters each of which is the parameter of the
@@ -943,6 +1659,82 @@ class ExperimentTask(waflib.Task.Task):
                     upd(v)
         return self.m.digest()
 
+    def uid(self):
+        """Returns the unique id of this task.
+
+        Overriden from waflib.Task.Task to use the name of the task generator
+        instead of the class name, which is shared by the tasks of the same
+        rule.
+
+        """
+        try:
+            return self.uid_
+        except AttributeError:
+            m = waflib.Utils.md5()
+            m.update(self.generator.name)
+            for x in self.inputs + self.outputs:
+                m.update(x.abspath())
+            self.uid_ = m.digest()
+            return self.uid_
+
+    def __str__(self):
+        src_str = ' '.join([a.nice_path() for a in self.inputs])
+        tgt_str = ' '.join([a.nice_path() for a in self.outputs])
+        sep = ' -> ' if self.outputs else ''
+        return '%s: %s%s%s\n' % (self.generator.name, src_str, sep, tgt_str)
+
+    def post_run(self):
+        """Stores the outputs to the build cache after the outputs are checked.
+
+        Overriden from waflib.Task.Task. See also :py:meth:`restore_outputs`.
+
+        """
+        super(ExperimentTask, self).post_run()
+        if not getattr(self, 'restored', False):
+            key = self.build_cache_key()
+            if key is not None:
+                self.generator.bld.build_cache.store(
+                    key, [node.abspath() for node in self.outputs])
+
+    def restore_outputs(self):
+        """Restores the outputs from the build cache instead of running.
+
+        :return: True if the outputs are restored.
+        :rtype: ``bool``
+
+        """
+        key = self.build_cache_key()
+        if key is None:
+            return False
+        self.restored = self.generator.bld.build_cache.restore(
+            key, [node.abspath() for node in self.outputs])
+        return self.restored
+
+    def build_cache_key(self):
+        """Returns the key of the outputs in the build cache.
+
+        The key is the digest of the signature of the task (i.e. the
+        signatures of the inputs, the rule and the parameters), the number of
+        outputs and the digest of the rule function including values captured
+        by it (see :py:func:`_rule_digest`). It does not depend on paths, so
+        outputs are shared by checkouts, variants and machines.
+
+        :return: Hex digest, or None if the build cache is disabled or the task
+            cannot be cached.
+        :rtype: ``str`` or None
+
+        """
+        if getattr(self.generator.bld, 'build_cache', None) is None:
+            return None
+        digest = getattr(self.generator, 'rule_digest', None)
+        if digest is None or not self.outputs:
+            return None
+        m = waflib.Utils.md5()
+        m.update(self.signature())
+        m.update(digest)
+        m.update(str(len(self.outputs)))
+        return m.hexdigest()
+
 
 class ExperimentNode(object):
     """A wrapper of Node object used in ExperimentTasks for replacement of
@@ -989,6 +1781,293 @@ class ExperimentNode(object):
     def abspath(self):
         return self.abspath_
 
+    def __getstate__(self):
+        # Only the path is passed to worker processes.
+        return {'abspath_': self.abspath_}
+
+
+class WorkerPool(object):
+    """Pool of worker processes that run registered functions.
+
+    Worker processes refer to functions by the indexes given at the
+    registration, so functions that cannot be pickled (e.g. ones defined in
+    wscript, or closures) can be run in them. Arguments and return values must
+    be picklable.
+
+    Workers are forked by :py:meth:`start`, which ExperimentContext calls for
+    all pools before running tasks, so that they inherit all functions
+    registered while wscripts are evaluated. Forking them while tasks are
+    running is avoided because workers would inherit pipes of subprocesses
+    running at the moment, and waf would wait for the end of the pipes forever.
+    Before :py:meth:`start` is called (e.g. in unit tests), a pool forked
+    before a function is registered is replaced by a new one. After that, a
+    function registered later (e.g. by a task creating a rule while running)
+    is called in the calling process instead.
+
+    """
+    def __init__(self, jobs_option, initializer=None):
+        """Constructs a pool without worker processes.
+
+        :param jobs_option: Name of the option of the number of worker
+            processes. ``--jobs`` is used if the option is not given.
+        :type jobs_option: ``str``
+        :param initializer: Function called by each worker process at start.
+        :type initializer: ``function`` or None
+
+        """
+        self._jobs_option = jobs_option
+        self._initializer = initializer
+        self._pool = None
+        self._num_functions = 0
+        self._registered = False
+        self._started = False
+        self._lock = threading.Lock()
+        _worker_pools.append(self)
+
+    def jobs(self):
+        """Returns the number of worker processes given by the options.
+
+        Users of the pool should call functions in their own process instead
+        of :py:meth:`apply` if it is one.
+
+        :rtype: ``int``
+
+        """
+        options = waflib.Options.options
+        return getattr(options, self._jobs_option, None) or \
+            getattr(options, 'jobs', 1)
+
+    def register(self, function):
+        """Registers a function to be run in worker processes.
+
+        :param function: Function to register.
+        :type function: ``function`` or callable object
+        :return: Index of the function passed to :py:meth:`apply`.
+        :rtype: ``int``
+
+        """
+        self._registered = True
+        _worker_functions.append(function)
+        return len(_worker_functions) - 1
+
+    def start(self):
+        """Forks worker processes if any function is registered to the pool and
+        :py:meth:`jobs` is more than one.
+
+        """
+        if self._registered and self.jobs() > 1:
+            self._get_pool(len(_worker_functions) - 1)
+        self._started = True
+
+    def apply(self, index, *args):
+        """Calls a registered function in a worker process and waits for it.
+
+        An exception raised by the function is re-raised as ``RuntimeError``
+        with the traceback in the worker process, since the exception itself
+        may not be picklable.
+
+        :param index: Index of the function returned by :py:meth:`register`.
+        :type index: ``int``
+        :param args: Arguments passed to the function.
+        :return: Return value of the function.
+
+        """
+        pool = self._get_pool(index)
+        if pool is None:
+            return _worker_functions[index](*args)
+        return pool.apply(_call_worker_function, (index, args))
+
+    def map(self, index, args_list):
+        """Calls a registered function for each arguments in parallel.
+
+        :param index: Index of the function returned by :py:meth:`register`.
+        :type index: ``int``
+        :param args_list: List of tuples of arguments passed to the function.
+        :type args_list: ``list`` of ``tuple``
+        :return: List of return values in the order of ``args_list``.
+        :rtype: ``list``
+
+        """
+        pool = self._get_pool(index)
+        if pool is None:
+            return [_worker_functions[index](*args) for args in args_list]
+        return pool.map(_call_worker_function_with_args,
+                        [(index, args) for args in args_list])
+
+    def close(self):
+        """Terminates worker processes. They are forked again when needed."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool.join()
+                self._pool = None
+            self._started = False
+
+    def _get_pool(self, index):
+        # Returns None if the function must be called in this process.
+        with self._lock:
+            if self._pool is None or self._num_functions <= index:
+                if self._started:
+                    return None
+                if self._pool is not None:
+                    self._pool.close()
+                self._pool = multiprocessing.Pool(
+                    max(1, self.jobs()), self._initializer)
+                self._num_functions = len(_worker_functions)
+            return self._pool
+
+
+class BuildCache(object):
+    """Content-addressed cache of outputs of tasks shared by builds.
+
+    Each entry is a directory named by the key of a task (see
+    :py:meth:`ExperimentTask.build_cache_key`) that holds copies of the
+    outputs named by their indexes. Entries are written to temporary
+    directories and renamed, so that builds on different checkouts or machines
+    can share one cache directory. Restoring an entry updates its mtime, and
+    entries are evicted in the order of their mtimes (i.e. least recently used
+    first) when the total size exceeds the limit.
+
+    The total size is kept in ``.size`` file in the directory, which is updated
+    by builds that store entries, so that the entries are listed only when the
+    size exceeds the limit. It may be inaccurate when entries are removed by
+    hand, and it is corrected whenever the entries are listed.
+
+    """
+    def __init__(self, path, max_size):
+        """Constructs a cache on a directory.
+
+        :param path: Path to the directory of the cache.
+        :type path: ``str``
+        :param max_size: Maximum total size of entries in bytes.
+        :type max_size: ``int``
+
+        """
+        self.path = path
+        self.max_size = max_size
+        self._stored_size = 0
+        self._lock = threading.Lock()
+
+    def restore(self, key, paths):
+        """Copies the outputs in an entry to given paths.
+
+        :param key: Key of the entry.
+        :type key: ``str``
+        :param paths: Paths of the outputs.
+        :type paths: ``list`` of ``str``
+        :return: True if the entry exists and is restored.
+        :rtype: ``bool``
+
+        """
+        entry = self._entry(key)
+        if not os.path.isdir(entry):
+            return False
+        try:
+            for i, path in enumerate(paths):
+                _copy_tree(os.path.join(entry, str(i)), path)
+        except (IOError, OSError) as e:
+            if os.path.isdir(entry):  # otherwise evicted by another build
+                waflib.Logs.warn(
+                    'Failed to restore outputs from the build cache: %s' % e)
+            return False
+        try:
+            os.utime(entry, None)
+        except OSError:
+            pass  # the cache may be read-only
+        return True
+
+    def store(self, key, paths):
+        """Copies outputs to an entry unless the entry exists. Errors are
+        logged as warnings and ignored.
+
+        :param key: Key of the entry.
+        :type key: ``str``
+        :param paths: Paths of the outputs.
+        :type paths: ``list`` of ``str``
+
+        """
+        entry = self._entry(key)
+        if os.path.isdir(entry):
+            return
+        tmpdir = None
+        try:
+            if not os.path.isdir(os.path.dirname(entry)):
+                try:
+                    os.makedirs(os.path.dirname(entry))
+                except OSError:
+                    if not os.path.isdir(os.path.dirname(entry)):
+                        raise
+            tmpdir = tempfile.mkdtemp(prefix='.tmp', dir=self.path)
+            for i, path in enumerate(paths):
+                _copy_tree(path, os.path.join(tmpdir, str(i)))
+            size = _tree_size(tmpdir)
+            os.rename(tmpdir, entry)
+            with self._lock:  # tasks are run by multiple threads
+                self._stored_size += size
+        except (IOError, OSError) as e:
+            # Failure of the cache (e.g. a full disk or a read-only shared
+            # directory) does not fail the task.
+            if tmpdir is not None:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+            if not os.path.isdir(entry):  # otherwise stored by another build
+                waflib.Logs.warn(
+                    'Failed to store outputs to the build cache: %s' % e)
+
+    def evict(self):
+        """Removes least recently used entries if the total size of entries
+        exceeds the limit, until it is 90% of the limit. Nothing is done unless
+        entries are stored by :py:meth:`store` since the last call. Errors are
+        logged as warnings and ignored.
+
+        """
+        if not self._stored_size:
+            return
+        index = os.path.join(self.path, '.size')
+        try:
+            with open(index + '.lock', 'a') as lock:
+                # Builds sharing the cache update the size one by one.
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    with open(index) as f:
+                        total = int(f.read()) + self._stored_size
+                except (IOError, ValueError):
+                    total = None  # the size is unknown
+                if total is None or total > self.max_size:
+                    total = self._evict_until(self.max_size * 9 // 10)
+                with _atomic_create_file(index) as f:
+                    f.write(str(total))
+        except (IOError, OSError) as e:
+            waflib.Logs.warn(
+                'Failed to evict entries of the build cache: %s' % e)
+        self._stored_size = 0
+
+    def _evict_until(self, max_size):
+        # Removes least recently used entries until the total size does not
+        # exceed max_size, and returns the total size.
+        entries = []
+        total = 0
+        for shard in _listdir(self.path):
+            for name in _listdir(os.path.join(self.path, shard)):
+                entry = os.path.join(self.path, shard, name)
+                try:
+                    mtime = os.stat(entry).st_mtime
+                except OSError:
+                    continue
+                size = _tree_size(entry)
+                entries.append((mtime, size, entry))
+                total += size
+
+        entries.sort()
+        for mtime, size, entry in entries:
+            if total <= max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+        return total
+
+    def _entry(self, key):
+        return os.path.join(self.path, key[:2], key)
+
 
 # Forces these commands run under ExperimentContext
 waflib.Build.CleanContext.__bases__ = (ExperimentContext,)
@@ -1045,6 +2124,14 @@ def register_experiment_task_with_rule(self):
     This snippet search for a task from cache_rule_attr dictionary first,
     so we set that dictionary beforehand.
 
+    A task class is created only once per rule and is shared by all task
+    generators with that rule (i.e., all physical tasks of a call object).
+    Creating one class per task generator makes the scheduler of waf slow,
+    because it groups tasks by their classes to compute the precedence
+    constraints. Since the class name no longer identifies a task generator,
+    :py:class:`ExperimentTask` uses the name of its generator instead for its
+    unique id and string representation.
+
     """
     self.name = str(getattr(self, 'name', None) or self.target or getattr(self.rule, '__name__', self.rule))
     params = {}
@@ -1053,11 +2140,25 @@ def register_experiment_task_with_rule(self):
     else:
         params['run'] = self.rule
 
-    # define ExperimentTask with a user-defined rule (string or function)
-    cls = type(waflib.Task.Task)(self.name, (ExperimentTask,), params)
+    # define ExperimentTask with a user-defined rule (string or function);
+    # all task generators sharing the same rule share the same class
+    try:
+        classes = self.bld.experiment_task_classes
+    except AttributeError:
+        classes = self.bld.experiment_task_classes = {}
+    try:
+        cls = classes[self.rule]
+    except KeyError:
+        cls = type(waflib.Task.Task)(self.name, (ExperimentTask,), params)
+        _restore_outputs_before_run(cls)
+        classes[self.rule] = cls
     waflib.Task.classes[self.name] = cls
 
-    self.bld.cache_rule_attr = {(self.name, self.rule):cls}
+    try:
+        cache = self.bld.cache_rule_attr
+    except AttributeError:
+        cache = self.bld.cache_rule_attr = {}
+    cache[(self.name, self.rule)] = cls
 
 
 def _create_file(path):
@@ -1072,6 +2173,45 @@ def _create_file(path):
     return open(path, 'w')
 
 
+@contextlib.contextmanager
+def _atomic_create_file(path, mode='w'):
+    """Opens file in write mode like :py:func:`_create_file`, but the file
+    appears at the path only after it is completely written.
+
+    """
+    dirname = os.path.dirname(path)
+    if dirname and not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    # The temporary file is unique even among threads of one process.
+    fd, tmp_path = tempfile.mkstemp(
+        dir=dirname or '.', prefix='.%s.' % os.path.basename(path))
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.rename(tmp_path, path)
+    except:
+        os.remove(tmp_path)
+        raise
+
+
+def _resolve_parameter_keys(parameter_keys, rule):
+    # parameter_keys is a list (or a space-separated string) of keys, or True
+    # to infer the keys from ${...} in the string rule. Keys are sorted to be
+    # used as a part of the key of the graph cache.
+    if parameter_keys is True:
+        if not isinstance(rule, str):
+            raise InvalidMafArgumentException(
+                "'parameter_keys' can be inferred only from a string rule")
+        keys = set(_RULE_VARIABLE.findall(rule)) - set(['SRC', 'TGT'])
+    else:
+        keys = waflib.Utils.to_list(parameter_keys)
+    return sorted(keys)
+
+
+_RULE_VARIABLE = re.compile(r'(?<!\$)\$\{(\w+)')
+
+
 def _let_element_to_be_list(d, key):
     if key not in d:
         d[key] = []
@@ -1086,10 +2226,335 @@ def _to_list(objs):
         return [objs]
 
 
+def _join_parameters(relations):
+    """Enumerates all combinations of parameters that do not conflict.
+
+    It is equivalent to filtering the direct product of ``relations`` by
+    :py:meth:`Parameter.conflict_with`, but is computed like an equi-join of
+    databases: parameters of each relation are indexed by the values of keys
+    shared with the combinations built so far, and compatible parameters are
+    found by hash lookup. Its cost is linear to the sizes of inputs and
+    outputs, while the naive product is quadratic or worse.
+
+    :param relations: Lists of parameters. Parameters in a list may have
+        different sets of keys.
+    :type relations: ``list`` of iterables of :py:class:`Parameter`
+    :return: List of combinations. Each combination is a list that contains
+        one parameter from each relation in the same order as ``relations``.
+    :rtype: ``list`` of ``list`` of :py:class:`Parameter`
+
+    """
+    # Each row is a pair of a combination and a merged dictionary of it.
+    rows = [((), {})]
+    for relation in relations:
+        # Group rows and parameters by their key sets, so that all elements in
+        # a group share the same join keys.
+        row_groups = collections.defaultdict(list)
+        for row in rows:
+            row_groups[frozenset(row[1])].append(row)
+        parameter_groups = collections.defaultdict(list)
+        for parameter in relation:
+            parameter_groups[frozenset(parameter)].append(parameter)
+
+        new_rows = []
+        for parameter_keys, parameters in parameter_groups.iteritems():
+            indices = {}
+            for row_keys, group in row_groups.iteritems():
+                keys = tuple(sorted(parameter_keys & row_keys))
+                if keys not in indices:
+                    index = collections.defaultdict(list)
+                    for parameter in parameters:
+                        index[tuple(parameter[k] for k in keys)].append(
+                            parameter)
+                    indices[keys] = index
+                index = indices[keys]
+
+                for combination, merged in group:
+                    matched = index.get(tuple(merged[k] for k in keys))
+                    if not matched:
+                        continue
+                    for parameter in matched:
+                        new_merged = dict(merged)
+                        new_merged.update(parameter)
+                        new_rows.append((combination + (parameter,), new_merged))
+        rows = new_rows
+
+    return [list(combination) for combination, _ in rows]
+
+
 def _is_callable(o):
     return isinstance(o, types.FunctionType) or hasattr(o, '__call__')
 
 
+_callable_fingerprints = {}
+
+
+def _callable_key(fun):
+    """Calculates a key of the behavior of a callable object in this process.
+
+    Functions have the same key if they share the code and the global namespace
+    and their default arguments and closures have the same values, e.g.
+    closures returned by two calls of ``maflib.rules.max('v')``. Values other
+    than scalars and containers of them are compared by their identities, and
+    so are callable objects other than functions. It is used to find duplicated
+    tasks of rules without :py:func:`_rule_digest`.
+
+    :param fun: Callable object.
+    :type fun: ``callable``
+    :return: Hashable key of ``fun``.
+
+    """
+    return _value_key(fun, frozenset())
+
+
+def _value_key(value, seen):
+    if type(value) in _SCALAR_TYPES:
+        return (type(value), value)
+    if id(value) in seen:
+        return ('id', id(value))
+    seen = seen | frozenset([id(value)])
+
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_value_key(v, seen) for v in value))
+    if isinstance(value, dict):
+        return (type(value), tuple(sorted(
+            (_value_key(k, seen), _value_key(v, seen))
+            for k, v in value.iteritems())))
+    if isinstance(value, types.FunctionType):
+        return (value.__code__, id(value.__globals__),
+                tuple(_value_key(d, seen) for d in value.__defaults__ or ()),
+                tuple(_value_key(c.cell_contents, seen)
+                      for c in value.__closure__ or ()))
+    return ('id', id(value))
+
+
+_SCALAR_TYPES = frozenset(
+    [int, long, float, bool, str, unicode, type(None)])
+
+# Arguments of task generators that do not change the behavior of tasks.
+_TASK_KEY_EXCLUDED_ATTRIBUTES = frozenset(
+    ['rule', 'name', 'rel_source', 'rel_target', 'wscript'])
+
+
+def _attribute_key(value):
+    # Key of an argument of a task generator, which is its stable
+    # representation (see _stable_repr) if any, or its identity otherwise.
+    try:
+        return _stable_repr(value, frozenset())
+    except (ValueError, TypeError, IOError):
+        return _value_key(value, frozenset())
+
+
+def _link_outputs(task):
+    # Rule of tasks duplicated with another task, whose outputs are given as
+    # the inputs.
+    for source, target in zip(task.inputs, task.outputs):
+        _link_or_copy_tree(source.abspath(), target.abspath())
+
+
+def _link_or_copy_tree(src, dst):
+    if os.path.isdir(dst) and not os.path.islink(dst):
+        shutil.rmtree(dst)
+    elif os.path.lexists(dst):
+        os.remove(dst)
+
+    if not os.path.isdir(src):
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+        return
+
+    os.makedirs(dst)
+    for name in os.listdir(src):
+        _link_or_copy_tree(os.path.join(src, name), os.path.join(dst, name))
+
+
+def _restore_outputs_before_run(cls):
+    # Wraps the run method of a task class to restore outputs from the build
+    # cache instead of running the task.
+    run = cls.run
+
+    def restore_or_run(task):
+        if task.restore_outputs():
+            return 0
+        return run(task)
+
+    cls.run = restore_or_run
+
+
+def _build_cache_dir():
+    option = getattr(waflib.Options.options, 'build_cache', None)
+    if option is not None:
+        return option
+    return os.environ.get('MAF_BUILD_CACHE', '')
+
+
+def _copy_tree(src, dst):
+    if os.path.isdir(dst) and not os.path.islink(dst):
+        shutil.rmtree(dst)
+    elif os.path.lexists(dst):
+        os.remove(dst)
+
+    if os.path.isdir(src):
+        shutil.copytree(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+
+
+def _tree_size(path):
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                size += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                pass
+    return size
+
+
+def _listdir(path):
+    # Lists entries except temporary ones, or nothing if path does not exist.
+    try:
+        return [name for name in os.listdir(path) if not name.startswith('.')]
+    except OSError:
+        return []
+
+
+def _rule_digest(fun):
+    """Calculates a digest of a rule function stable across processes.
+
+    Unlike :py:func:`_callable_key`, the digest is made from the fingerprints
+    of source codes (see :py:func:`_callable_fingerprint`), and it includes
+    the values of default arguments, closures and global variables used by the
+    function, so that it can be used as a part of the key of the build cache.
+
+    :param fun: Rule function.
+    :type fun: ``callable``
+    :return: Hex digest, or None if the function captures a value whose
+        representation is not stable (e.g. an object other than scalars,
+        containers, functions, classes and modules).
+    :rtype: ``str`` or None
+
+    """
+    try:
+        representation = _stable_repr(fun, frozenset())
+    except (ValueError, TypeError, IOError):
+        return None
+    m = waflib.Utils.md5()
+    m.update(representation)
+    return m.hexdigest()
+
+
+def _stable_repr(value, seen):
+    if type(value) in _SCALAR_TYPES:
+        return repr(value)
+    if isinstance(value, types.ModuleType):
+        return 'module:' + value.__name__
+    if isinstance(value, (type, types.ClassType)):
+        # Classes are represented by their names, so ones not importable by
+        # the names (e.g. defined in wscripts) are not stable.
+        module = sys.modules.get(value.__module__)
+        if getattr(module, value.__name__, None) is not value:
+            raise ValueError('class not importable: %r' % value)
+        return 'class:%s.%s' % (value.__module__, value.__name__)
+    if id(value) in seen:
+        raise ValueError('recursive value')
+    seen = seen | frozenset([id(value)])
+
+    if isinstance(value, (list, tuple)):
+        return '%s(%s)' % (type(value).__name__, ','.join(
+            _stable_repr(v, seen) for v in value))
+    if isinstance(value, dict):
+        return 'dict(%s)' % ','.join(sorted(
+            '%s:%s' % (_stable_repr(k, seen), _stable_repr(v, seen))
+            for k, v in value.iteritems()))
+    if isinstance(value, types.FunctionType):
+        names = [name for name in value.__code__.co_names
+                 if name in value.__globals__]
+        return 'function(%s;%s;%s;%s)' % (
+            _callable_fingerprint(value),
+            ','.join(_stable_repr(d, seen) for d in value.__defaults__ or ()),
+            ','.join(_stable_repr(c.cell_contents, seen)
+                     for c in value.__closure__ or ()),
+            ','.join('%s=%s' % (name, _stable_repr(value.__globals__[name], seen))
+                     for name in sorted(names)))
+    raise ValueError('unstable representation: %r' % type(value))
+
+
+def _callable_fingerprint(fun):
+    """Calculates the fingerprint of the source code of a callable object.
+
+    The fingerprint is a digest of the dumped AST of the source code, which
+    includes its constants but not comments, line numbers and whitespaces. If
+    the source code cannot be parsed alone (e.g. a lambda written in a middle
+    of an expression), the digest of its whitespace-normalized text is used
+    instead. Results are memoized per callable, so the source code is read
+    only once per build.
+
+    :param fun: Callable object.
+    :type fun: ``callable``
+    :return: Hex digest of the normalized source code.
+    :rtype: ``str``
+
+    """
+    try:
+        return _callable_fingerprints[fun]
+    except (KeyError, TypeError):
+        pass
+
+    source = inspect.getsource(fun)
+    try:
+        normalized = ast.dump(ast.parse(textwrap.dedent(source)))
+    except SyntaxError:
+        normalized = ' '.join(source.split())
+    m = waflib.Utils.md5()
+    m.update(normalized)
+    fingerprint = m.hexdigest()
+
+    try:
+        _callable_fingerprints[fun] = fingerprint
+    except TypeError:
+        pass
+    return fingerprint
+
+
+def _not_deleted_any_files_in(node):
+    children = getattr(node, 'children', {})
+    if not children:
+        return os.path.exists(node.abspath())
+    else:
+        return all([_not_deleted_any_files_in(c) for c in children.values()])
+
+
+def _directory_manifest(path):
+    """Lists all entries under a directory with their stats.
+
+    os.scandir is not available on Python 2, so entries are listed by os.walk
+    and each of them is stat'ed once.
+
+    :param path: Path to a directory.
+    :type path: ``str``
+    :return: Sorted tuple of ``(relative path, size, mtime, inode)`` of the
+        entries, or None if the directory does not exist.
+    :rtype: ``tuple`` or ``None``
+
+    """
+    if not os.path.isdir(path):
+        return None
+    manifest = []
+    for dirpath, dirnames, filenames in os.walk(path):
+        for name in dirnames + filenames:
+            entry = os.path.join(dirpath, name)
+            try:
+                st = os.lstat(entry)
+            except OSError:
+                continue
+            manifest.append((os.path.relpath(entry, path), st.st_size,
+                             st.st_mtime, st.st_ino))
+    return tuple(sorted(manifest))
+
+
 def _node_sig(node):
     """An extended version of `Node.get_bld_sig`.
 
@@ -1113,8 +2578,75 @@ def _node_sig(node):
                 m.update(_node_sig(node.make_node(child)))
             node.sig = m.digest()
         else:
-            node.sig = waflib.Utils.h_file(path)
-            
+            cache = getattr(node.ctx, '_signature_cache', None)
+            if cache is None:
+                node.sig = waflib.Utils.h_file(path)
+            else:
+                node.sig = cache.get(path)
+
     node.cache_sig = ret = node.sig
     
     return ret
+
+
+class _DetachedTask(object):
+    # Picklable copy of a task passed to a rule run in a worker process.
+    def __init__(self, task):
+        self.inputs = [_detach_node(node) for node in task.inputs]
+        self.outputs = [_detach_node(node) for node in task.outputs]
+        self.parameter = task.parameter
+        self.source_parameters = task.source_parameters
+        self.env = waflib.ConfigSet.ConfigSet()
+        self.env.table = task.env.get_merged_dict()
+
+    def __getstate__(self):
+        # ConfigSet cannot be pickled since its __getattr__ returns [] for
+        # unknown attributes including __getstate__.
+        state = dict(self.__dict__)
+        state['env'] = self.env.table
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.env = waflib.ConfigSet.ConfigSet()
+        self.env.table = state['env']
+
+
+def _detach_node(node):
+    # Waf nodes cannot be pickled since they refer to the whole tree.
+    if isinstance(node, ExperimentNode):
+        return node
+    return ExperimentNode(node)
+
+
+def _rule_runner(rule):
+    # Returns the run method of tasks of a rule given by a Rule object. The
+    # same function is returned whether or not the rule runs in the process
+    # pool, since its source code is a part of the signatures of tasks (hcode).
+    index = None
+    if rule.process_pool or \
+       getattr(waflib.Options.options, 'process_rules', False):
+        index = _rule_pool.register(rule.fun)
+
+    def run(task):
+        if index is None or _rule_pool.jobs() <= 1:
+            return rule.fun(task)
+        return _rule_pool.apply(index, _DetachedTask(task))
+
+    return run
+
+
+def _call_worker_function_with_args(index_and_args):
+    return _call_worker_function(*index_and_args)
+
+
+def _call_worker_function(index, args):
+    try:
+        return _worker_functions[index](*args)
+    except Exception:
+        raise RuntimeError(traceback.format_exc())
+
+
+_worker_functions = []
+_worker_pools = []
+_rule_pool = WorkerPool('rule_jobs')
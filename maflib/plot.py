@@ -23,14 +23,13 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import cPickle
 import functools
+import sys
 
-# These two lines are necessary for desktop-enabled environment.
-import matplotlib
-matplotlib.use('Agg')
-
-import matplotlib.pyplot
+import numpy
 
+import maflib.core
 import maflib.util
 
 class PlotData:
@@ -41,6 +40,10 @@ class PlotData:
     dictionaries. This class is used to collect all dictionaries through the
     meta node and to extract point sequences to plot.
 
+    Values of each key are converted to a column of NumPy arrays when the key is
+    used first, and rows are grouped by each ``key`` argument only once, so
+    extracting sequences many times from the same data is cheap.
+
     """
     def __init__(self, inputs):
         """Constructs a plot data from a list of values to be plotted.
@@ -52,6 +55,8 @@ class PlotData:
 
         """
         self._inputs = inputs
+        self._columns = {}  # key -> _Column
+        self._groups = {}  # key argument -> list of (key value, rows)
 
     def get_data_1d(self, x, key=None, sort=True):
         """Extracts a sequence of one-dimensional data points.
@@ -74,36 +79,10 @@ class PlotData:
         :rtype: ``dict`` or ``list``
 
         """
+        data = self._get_data((x,), key, sort)
         if key is None:
-            xs = [value[x] for value in self._inputs if x in value]
-            if sort:
-                xs.sort()
-            return xs
-
-        data = {}
-        for value in self._inputs:
-            if x not in value:
-                continue
-
-            if isinstance(key, str):
-                if key not in value:
-                    continue
-                key_value = value[key]
-            else:
-                key_value = tuple((value[k] for k in key if k in value))
-                if len(key) != len(key_value):
-                    continue
-
-            if key_value not in data:
-                data[key_value] = []
-
-            data[key_value].append(value[x])
-
-        if sort:
-            for k in data:
-                data[k].sort()
-
-        return data
+            return data[0]
+        return dict((k, v[0]) for k, v in data.iteritems())
 
     def get_data_2d(self, x, y, key=None, sort=True):
         """Extracts a sequence of two-dimensional data points.
@@ -128,38 +107,7 @@ class PlotData:
         :rtype: ``dict`` or ``tuple`` of two ``list`` s
 
         """
-        if key is None:
-            vals = [(value[x], value[y])
-                    for value in self._inputs if x in value and y in value]
-            if sort:
-                vals.sort()
-            return ([v[0] for v in vals], [v[1] for v in vals])
-
-        data = {}
-        for value in self._inputs:
-            if x not in value or y not in value:
-                continue
-
-            if isinstance(key, str):
-                if key not in value:
-                    continue
-                key_value = value[key]
-            else:
-                key_value = tuple((value[k] for k in key if k in value))
-                if len(key) != len(key_value):
-                    continue
-
-            if key_value not in data:
-                data[key_value] = []
-
-            data[key_value].append((value[x], value[y]))
-
-        for k in data:
-            if sort:
-                data[k].sort()
-            data[k] = ([v[0] for v in data[k]], [v[1] for v in data[k]])
-
-        return data
+        return self._get_data((x, y), key, sort)
 
     def get_data_3d(self, x, y, z, key=None, sort=True):
         """Extracts a sequence of three-dimensional data points.
@@ -187,50 +135,159 @@ class PlotData:
         :rtype: ``dict`` or ``tuple`` of three ``list`` s.
 
         """
+        return self._get_data((x, y, z), key, sort)
+
+    def _get_data(self, coords, key, sort):
+        # Returns a tuple of value sequences of coords if key is None, or a
+        # dictionary from key values to them otherwise.
+        columns = [self._column(c) for c in coords]
+        present = columns[0].present
+        for column in columns[1:]:
+            present = present & column.present
+
         if key is None:
-            vals = [(value[x], value[y], value[z])
-                    for value in self._inputs
-                    if x in value and y in value and z in value]
-            if sort:
-                vals.sort()
-            return (
-                [v[0] for v in vals],
-                [v[1] for v in vals],
-                [v[2] for v in vals])
+            groups = [(None, numpy.arange(len(self._inputs)))]
+        else:
+            groups = self._group(key)
 
         data = {}
-        for value in self._inputs:
-            if not (x in value and y in value and z in value):
+        for key_value, rows in groups:
+            rows = rows[present[rows]]
+            if len(rows) == 0:
                 continue
-
-            if isinstance(key, str):
-                if key not in value:
-                    continue
-                key_value = value[key]
-            else:
-                key_value = tuple((value[k] for k in key if k in value))
-                if len(key) != len(key_value):
-                    continue
-
-            if key_value not in data:
-                data[key_value] = []
-
-            data[key_value].append((value[x], value[y], value[z]))
-
-        for k in data:
             if sort:
-                data[k].sort()
-            data[k] = (
-                [v[0] for v in data[k]],
-                [v[1] for v in data[k]],
-                [v[2] for v in data[k]])
+                rows = rows[_sort_order(columns, rows)]
+            data[key_value] = tuple(c.objects[rows].tolist() for c in columns)
 
+        if key is None:
+            return data.get(None, tuple([] for c in coords))
         return data
 
+    def _column(self, k):
+        try:
+            return self._columns[k]
+        except KeyError:
+            column = self._columns[k] = _Column(self._inputs, k)
+            return column
+
+    def _group(self, key):
+        # Returns a list of pairs of a key value and an array of rows that have
+        # the key value, where rows are in the order of inputs.
+        try:
+            return self._groups[key]
+        except KeyError:
+            pass
+
+        keys = (key,) if isinstance(key, str) else tuple(key)
+        columns = [self._column(k) for k in keys]
+        present = columns[0].present
+        for column in columns[1:]:
+            present = present & column.present
+        rows = numpy.flatnonzero(present)
+
+        # rows are encoded to the mixed radix representation of the codes of
+        # the key values
+        codes = numpy.zeros(len(rows), dtype=numpy.int64)
+        for column in columns:
+            column_codes, num_codes = _encode(column.objects[rows])
+            codes = codes * num_codes + column_codes
+        order = numpy.argsort(codes, kind='mergesort')
+        boundaries = numpy.flatnonzero(numpy.diff(codes[order])) + 1
+
+        groups = []
+        for group in numpy.split(rows[order], boundaries):
+            if len(group) == 0:
+                continue
+            first = group[0]
+            if isinstance(key, str):
+                key_value = columns[0].objects[first]
+            else:
+                key_value = tuple(c.objects[first] for c in columns)
+            groups.append((key_value, group))
+        self._groups[key] = groups
+        return groups
+
+
+class _Column(object):
+    # Values of a key through all inputs.
+    def __init__(self, inputs, key):
+        n = len(inputs)
+        self.present = numpy.fromiter(
+            (key in value for value in inputs), dtype=bool, count=n)
+        """Mask of inputs that have the key."""
+
+        values = [value.get(key) for value in inputs]
+        self.objects = numpy.empty(n, dtype=object)
+        """Values as they are, or None for inputs without the key."""
+        if _SEQUENCE_TYPES.isdisjoint(map(type, values)):
+            self.objects[:] = values
+        else:
+            # avoid NumPy broadcasting sequence values
+            for i, value in enumerate(values):
+                self.objects[i] = value
+
+        self.numbers = None
+        """Values as float numbers if all values are numbers exactly
+        representable by float, or None."""
+        floats = _exact_floats(self.objects[self.present].tolist())
+        if floats is not None:
+            self.numbers = numpy.zeros(n)
+            self.numbers[self.present] = floats
+
+
+_NUMBER_TYPES = frozenset([int, long, float, bool])
+
+# Integers up to this magnitude are exactly representable by float.
+_MAX_EXACT_INT = 2 ** 53
+_SEQUENCE_TYPES = frozenset([list, tuple, dict])
+
+
+def _sort_order(columns, rows):
+    # Returns the order of rows sorted lexicographically by the columns.
+    if all(c.numbers is not None for c in columns):
+        return numpy.lexsort([c.numbers[rows] for c in reversed(columns)])
+    values = [c.objects[rows].tolist() for c in columns]
+    return numpy.array(
+        sorted(range(len(rows)), key=lambda i: tuple(v[i] for v in values)),
+        dtype=int)
+
+
+def _encode(objects):
+    # Returns codes of values such that equal values have the same code, and
+    # the number of distinct codes.
+    values = objects.tolist()
+    array = _exact_floats(values)
+    if array is None and set(map(type, values)) == set([str]):
+        array = numpy.array(values)
+    if array is not None:
+        unique, codes = numpy.unique(array, return_inverse=True)
+        return codes, len(unique)
+    index = {}
+    codes = [index.setdefault(v, len(index)) for v in values]
+    return numpy.array(codes, dtype=numpy.int64), len(index)
+
+
+def _exact_floats(values):
+    # Returns values as a float array, or None if some value is not a number or
+    # not exactly representable by float (e.g. a large integer).
+    if not set(map(type, values)) <= _NUMBER_TYPES:
+        return None
+    integers = [v for v in values if type(v) in (int, long)]
+    if integers and (max(integers) > _MAX_EXACT_INT or
+                     min(integers) < -_MAX_EXACT_INT):
+        return None
+    return numpy.array(values, dtype=float)
+
 
 def plot_by(callback_body):
     """Creates an aggregator to plot data using matplotlib and PlotData.
 
+    If ``--plot_jobs`` option is more than one (or zero and ``--jobs`` is more
+    than one), figures of different tasks are rendered in parallel by that
+    number of worker processes. A figure whose parameters cannot be pickled is
+    rendered in the calling process. matplotlib is imported only when a figure
+    is rendered.
+
     :param callback_body: Callable object or function that plots data. It takes
         three parameters: :py:class:`matplotlib.figure.Figure` object,
         :py:class:`maflib.plot.PlotData` object and a parameter of class
@@ -240,14 +297,24 @@ def plot_by(callback_body):
         (:py:class:`matplotlib.figure.Figure`, :py:class:`PlotData`).
 
     """
+    index = _plot_pool.register(functools.partial(_render, callback_body))
+
     @functools.wraps(callback_body)
-    @maflib.util.aggregator
-    def callback(values, abspath, parameter):
-        figure = matplotlib.pyplot.figure()
-        plot_data = PlotData(values)
-        callback_body(figure, plot_data, parameter)
-        figure.savefig(abspath)
-        return None
+    @maflib.util.rule
+    def callback(task):
+        args = ([node.abspath() for node in task.inputs],
+                task.source_parameters,
+                task.outputs[0].abspath(),
+                task.parameter)
+        if _plot_pool.jobs() > 1:
+            try:
+                _plot_pool.apply(index, *args)
+                return
+            except (cPickle.PicklingError, TypeError):
+                # Errors in the worker are re-raised as RuntimeError, so these
+                # are raised by pickling the arguments.
+                pass
+        _render(callback_body, *args)
 
     return callback
 
@@ -298,3 +365,27 @@ def plot_line(x, y, legend=None):
             axes.plot(xs, ys)
 
     return plot_by(callback)
+
+
+def _import_pyplot():
+    if 'matplotlib.pyplot' not in sys.modules:
+        # These two lines are necessary for desktop-enabled environment.
+        import matplotlib
+        matplotlib.use('Agg')
+
+    import matplotlib.pyplot
+    return matplotlib.pyplot
+
+
+def _render(callback_body, paths, source_parameters, abspath, parameter):
+    values = maflib.util.load_values(paths, source_parameters)
+    pyplot = _import_pyplot()
+    figure = pyplot.figure()
+    try:
+        callback_body(figure, PlotData(values), parameter)
+        figure.savefig(abspath)
+    finally:
+        pyplot.close(figure)
+
+
+_plot_pool = maflib.core.WorkerPool('plot_jobs', _import_pyplot)
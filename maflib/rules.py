@@ -23,44 +23,200 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import array
+import bisect
+import bz2
 import collections
+import contextlib
 import copy
+import cStringIO
+import fcntl
+import hashlib
+import itertools
 import json
+import os
 import os.path
+import re
+import shutil
+import struct
 import tempfile
 import urllib
+import urllib2
+import zipfile
+import zlib
 from contextlib import nested
 
+import numpy
+import numpy.lib.format
+import waflib.Options
+
 import maflib.core
 import maflib.util
 
-def download(url, decompress_as=''):
+def download(url, decompress_as='', sha256=None, cache_dir=None):
     """Create a rule to download a file from given URL.
 
     It stores the file to the target node. If ``decompress_as`` is given, then
     it automatically decompresses the downloaded file.
 
+    If a cache directory is given by ``cache_dir``, ``--download_cache`` option
+    or ``MAF_DOWNLOAD_CACHE`` environment variable (in this order of
+    precedence), downloaded files are stored in a :py:class:`DownloadCache`
+    there, so that a file once downloaded is not downloaded again even in other
+    checkouts. The target node is a copy of the cached file. The cache is
+    disabled by default or if the directory is an empty string.
+
     :param url: URL string of the file to be downloaded.
     :type url: ``str``
     :param decompress_as: Decompression method of downloaded file. If an empty
         string is given, then this function does not do decompression.
-        ``'bz2'``, ``'gz'`` or ``'zip'`` is available.
+        ``'bz2'``, ``'gz'``, ``'xz'``, ``'lzma'`` or ``'zip'`` is available.
+        If the cache is disabled, the file is decompressed while downloading
+        except for ``'zip'``.
+    :param sha256: Expected SHA-256 hex digest of the downloaded file. If it is
+        given, the file is verified and the task fails on mismatch.
+    :type sha256: ``str``
+    :param cache_dir: Directory of the download cache.
+    :type cache_dir: ``str``
     :return: A rule.
     :rtype: :py:class:`maflib.core.Rule`
 
     """
     def body(task):
-        if decompress_as != '':
-            t = tempfile.NamedTemporaryFile()
-            urllib.urlretrieve(url, t.name)
-            _decompress(t.name, task.outputs[0].abspath(), decompress_as)
+        output = task.outputs[0].abspath()
+        directory = _download_cache_dir(cache_dir)
+        if not directory and sha256 is None:
+            _download_without_cache(url, output, decompress_as)
+            return
+
+        if directory:
+            cached = DownloadCache(directory).fetch(url, sha256)
+            _materialize(cached, output, decompress_as)
         else:
-            urllib.urlretrieve(url, task.outputs[0].abspath())
-
-    return maflib.core.Rule(fun=body, dependson=[download, url])
+            # a temporary cache is used to verify the checksum
+            directory = tempfile.mkdtemp()
+            try:
+                cached = DownloadCache(directory).fetch(url, sha256)
+                _materialize(cached, output, decompress_as)
+            finally:
+                shutil.rmtree(directory)
+
+    return maflib.core.Rule(fun=body, dependson=[download, url, sha256])
+
+
+class DownloadCache(object):
+    """Content-addressed cache of downloaded files.
+
+    Files are stored as ``objects/<sha256 of the content>``, and each URL is
+    mapped to the digest of its content by ``urls/<sha256 of the URL>``. The
+    mapping also records the ETag or Last-Modified of the response, and a mapped
+    file is used only after the server answers 304 Not Modified to a request
+    with ``If-None-Match`` or ``If-Modified-Since``; a mapping without either
+    validator is not trusted, so the file is downloaded again. A file
+    being downloaded is written to ``partial/<sha256 of the URL>``, and an
+    interrupted download is resumed by an HTTP Range request with an
+    ``If-Range`` validator (ETag or Last-Modified of the first response), so
+    that a file changed on the server is downloaded again from the beginning.
+    Downloads whose sizes do not match the Content-Length fail, and the URL of
+    a file whose size cannot be verified is not mapped, so it is downloaded
+    again by the next build unless its SHA-256 is given. Stored files are
+    read-only; build trees get copies of them.
 
-
-def decompress(filetype='auto'):
+    """
+    def __init__(self, path):
+        """Initializes the cache.
+
+        :param path: Path to the directory of the cache.
+        :type path: str
+
+        """
+        self.path = path
+        """Path to the directory of the cache."""
+
+    def fetch(self, url, sha256=None):
+        """Returns the path to the cached file of the URL, downloading it if
+        necessary.
+
+        :param url: URL of the file.
+        :type url: str
+        :param sha256: Expected SHA-256 hex digest of the file. If it is given,
+            a file with this digest is used regardless of the URL without
+            asking the server, and the downloaded file is verified.
+        :type sha256: str
+        :return: Path to the cached file.
+        :rtype: str
+
+        """
+        if sha256 is not None:
+            sha256 = sha256.lower()
+        key = hashlib.sha256(url).hexdigest()
+        for name in ['objects', 'urls', 'partial']:
+            _makedirs(os.path.join(self.path, name))
+
+        with open(os.path.join(self.path, 'partial', key + '.lock'), 'w') as lock:
+            # Downloads of the same URL are serialized, even among processes.
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if sha256 is not None:
+                if os.path.exists(self._object_path(sha256)):
+                    return self._object_path(sha256)
+                mapped, conditions = None, {}
+            else:
+                mapped, conditions = self._lookup(key)
+
+            partial = os.path.join(self.path, 'partial', key)
+            try:
+                digest, verified, validator = _download_resumable(
+                    url, partial, conditions)
+            except urllib2.HTTPError as e:
+                if e.code != 304:
+                    raise
+                return self._object_path(mapped)
+            if sha256 is not None and digest != sha256:
+                os.remove(partial)
+                _remove_if_exists(partial + '.validator')
+                raise Exception(
+                    "SHA-256 of %s is %s, but %s is expected." %
+                    (url, digest, sha256))
+
+            path = self._object_path(digest)
+            if os.path.exists(path):
+                os.remove(partial)
+            else:
+                os.chmod(partial, 0444)
+                os.rename(partial, path)
+            _remove_if_exists(partial + '.validator')
+            if not verified and sha256 is None:
+                return path
+
+            url_path = os.path.join(self.path, 'urls', key)
+            with open(url_path + '.tmp', 'w') as f:
+                f.write(digest + '\n')
+                if validator:
+                    f.write(validator + '\n')
+            os.rename(url_path + '.tmp', url_path)
+            return path
+
+    def _lookup(self, key):
+        # Returns the digest mapped from the URL and the headers to ask the
+        # server whether the file is changed, or (None, {}) if the mapped file
+        # cannot be revalidated.
+        try:
+            with open(os.path.join(self.path, 'urls', key)) as f:
+                lines = f.read().splitlines()
+        except IOError:
+            return None, {}
+        if len(lines) < 2 or not os.path.exists(self._object_path(lines[0])):
+            return None, {}
+        digest, validator = lines[0], lines[1]
+        if validator.startswith('"') or validator.startswith('W/'):
+            return digest, {'If-None-Match': validator}
+        return digest, {'If-Modified-Since': validator}
+
+    def _object_path(self, digest):
+        return os.path.join(self.path, 'objects', digest)
+
+
+def decompress(filetype='auto', jobs=1):
     """A rule to decompress an input file.
 
     :param filetype: Type of compressed file. Following values are available.
@@ -69,19 +225,36 @@ def decompress(filetype='auto'):
           input file name.
         - ``'bz2'``: bzip2 file.
         - ``'gz'``: gzip file.
-        - ``'zip'``: zip file.
+        - ``'xz'`` or ``'lzma'``: xz or lzma file. It requires ``lzma``
+          module (``backports.lzma`` on Python 2).
+        - ``'zip'``: zip archive containing one file, or zlib stream.
+
+    Files are decompressed by fixed-size blocks, so the memory usage does not
+    depend on the file size.
+
+    :param jobs: Number of pieces decompressed at once. If it is greater
+        than one, a bzip2 file consisting of multiple streams (e.g. created by
+        pbzip2) or a BGZF file (block gzip, e.g. created by bgzip) is split at
+        the boundaries of streams or blocks, and the pieces are decompressed in
+        parallel by worker processes shared by the build (``--jobs`` of them,
+        forked before tasks run). Other files are decompressed in a single
+        process.
+    :type jobs: ``int``
     :type filetype: ``str``
     :return: A rule.
     :rtype: :py:class:`maflib.core.Rule`
 
     """
+    if jobs > 1:
+        _decompress_pool.register()
+
     def body(task):
         ft = filetype
         if ft == 'auto':
             ft = os.path.splitext(task.inputs[0].abspath())[1][1:]
 
         res = _decompress(
-            task.inputs[0].abspath(), task.outputs[0].abspath(), ft)
+            task.inputs[0].abspath(), task.outputs[0].abspath(), ft, jobs)
         if not res:
             raise Exception(
                 "Filetype %s is not supported in decompress." % ft)
@@ -93,7 +266,8 @@ def max(key):
     """Creates an aggregator to select the max value of given key.
 
     The created aggregator chooses the result with the maximum value of
-    ``key``, and writes the JSON object to the output node.
+    ``key``, and writes the JSON object to the output node. Inputs are read
+    one by one, so it runs in constant memory.
 
     :param key: A key to be used for selection of maximum value.
     :type key: ``str``
@@ -101,18 +275,9 @@ def max(key):
     :rtype: :py:class:`maflib.core.Rule`
 
     """
-    @maflib.util.json_aggregator
-    def body(values, outpath, parameter):
-        if len(values) == 0:
-            return json.dumps({})
-
-        max_value = values[0][key]
-        argmax = values[0]
-        for value in values[1:]:
-            if max_value < value[key]:
-                max_value = value[key]
-                argmax = value
-        return argmax
+    @maflib.util.json_stream_aggregator
+    def body(records, outpath, parameter):
+        return _select_by(records, lambda v, best: best[key] < v[key])
 
     return maflib.core.Rule(fun=body, dependson=[max, key])
 
@@ -121,7 +286,8 @@ def min(key):
     """Creates an aggregator to select the minimum value of given key.
 
     The created aggregator chooses the result with the minimum value of
-    ``key``, and writes the JSON object to the output node.
+    ``key``, and writes the JSON object to the output node. Inputs are read
+    one by one, so it runs in constant memory.
 
     :param key: A key to be used for selection of minimum value.
     :type key: ``str``
@@ -129,40 +295,53 @@ def min(key):
     :rtype: :py:class:`maflib.core.Rule`
 
     """
-    @maflib.util.json_aggregator
-    def body(values, outpath, parameter):
-        if len(values) == 0:
-            return json.dumps({})
-
-        min_value = values[0][key]
-        argmin = values[0]
-        for value in values[1:]:
-            if min_value > value[key]:
-                min_value = value[key]
-                argmin = value
-        return argmin
+    @maflib.util.json_stream_aggregator
+    def body(records, outpath, parameter):
+        return _select_by(records, lambda v, best: best[key] > v[key])
 
     return maflib.core.Rule(fun=body, dependson=[min, key])
 
 
-@maflib.util.json_aggregator
-def average(values, output, parameter):
+@maflib.util.json_stream_aggregator
+def average(records, output, parameter):
     """Aggregator that calculates the average value for each key.
 
-    The result contains all keys that some inputs contain. Each value is an
-    average value of the corresponding key through all the inputs. If there
-    is a value that cannot be passed to ``float()``, it omits the corresponding
-    key from the result.
+    The result contains all keys that the first input contains. Each value is
+    an average value of the corresponding key through all the inputs. If there
+    is a value that cannot be passed to ``float()``, the value of the first
+    input is used for the corresponding key. Inputs are read one by one and
+    averaged by chunks of NumPy arrays, so it runs in constant memory.
 
     """
-    scheme = copy.deepcopy(values[0])
-    for key in scheme:
-        try:
-            scheme[key] = sum(
-                float(v[key]) for v in values) / float(len(values))
-        except:
-            pass
-    return scheme
+    return _summarize(records, [])
+
+
+def summarize(stats=('std', 'min', 'max', 'count')):
+    """Creates an aggregator that calculates statistics for each key.
+
+    The result contains the same keys as :py:func:`average`, and additionally
+    contains ``<key>-<stat>`` for each numeric key (i.e. a key whose values can
+    be passed to ``float()`` for all inputs) and each statistic in ``stats``.
+    Available statistics are ``'std'`` (population standard deviation),
+    ``'min'``, ``'max'`` and ``'count'``.
+
+    :param stats: Statistics to calculate in addition to the average.
+    :type stats: ``list`` or ``tuple`` of ``str``
+    :return: An aggregator.
+    :rtype: :py:class:`maflib.core.Rule`
+
+    """
+    stats = list(stats)
+    for stat in stats:
+        if stat not in ['std', 'min', 'max', 'count']:
+            raise maflib.core.InvalidMafArgumentException(
+                "unknown statistic %s." % stat)
+
+    @maflib.util.json_stream_aggregator
+    def body(records, outpath, parameter):
+        return _summarize(records, stats)
+
+    return maflib.core.Rule(fun=body, dependson=[summarize, stats])
 
 
 def convert_libsvm_accuracy(task):
@@ -182,20 +361,46 @@ def convert_libsvm_accuracy(task):
 
 
 def create_label_result_libsvm(task):
-    """TODO(noji) write document."""
+    """Rule that pairs predicted labels by svm-predict with correct labels.
+
+    The first input is the output file of svm-predict, and the second input is
+    the test file in LIBSVM format. The output is the input of
+    :py:func:`calculate_stats_multiclass_classification`. If the name of the
+    output node ends with ``.npy``, the result is written as a NumPy array of
+    shape ``(N, 2)`` whose columns are predicted and correct labels, which is
+    much smaller and faster to load than JSON. Otherwise, it is written as a
+    JSON array of ``{"p": <predicted label>, "c": <correct label>}``.
+
+    :param task: waf task.
+    :type task: :py:class:`waflib.Task.Task`
+
+    """
     predict_f = task.inputs[0].abspath()
     test_f = task.inputs[1].abspath()
-    labels = {}
-    predict = [int(line.strip()) for line in open(predict_f)]
-    correct = [int(line.strip().split(' ')[0]) for line in open(test_f)]
-    if len(predict) != len(correct):
-        raise maflib.core.InvalidMafArgumentException(
-            "the number of lines of output file (%s) \
+    output_f = task.outputs[0].abspath()
+
+    labels = array.array('l')
+    with nested(open(predict_f), open(test_f)) as (predict, test):
+        for predict_line, test_line in itertools.izip_longest(predict, test):
+            if predict_line is None or test_line is None:
+                raise maflib.core.InvalidMafArgumentException(
+                    "the number of lines of output file (%s) \
 is not consistent with the one of test file (%s)." % (predict_f, test_f))
-    instances = []
-    for i in range(len(predict)):
-        instances.append({"p": predict[i], "c": correct[i]})
-    task.outputs[0].write(json.dumps(instances))
+            labels.append(int(predict_line.strip()))
+            labels.append(int(test_line.strip().split(' ')[0]))
+
+    result = numpy.frombuffer(labels, dtype=numpy.dtype(labels.typecode))
+    result = result.reshape(-1, 2)
+    if output_f.endswith('.npy'):
+        int32 = numpy.iinfo(numpy.int32)
+        if result.size == 0 or \
+                int32.min <= result.min() and result.max() <= int32.max:
+            result = result.astype(numpy.int32)
+        with open(output_f, 'wb') as f:
+            numpy.save(f, result)
+    else:
+        task.outputs[0].write(json.dumps(
+            [{"p": p, "c": c} for p, c in result.tolist()]))
 
 
 def calculate_stats_multiclass_classification(task):
@@ -204,7 +409,9 @@ def calculate_stats_multiclass_classification(task):
     The source of this task is assumed to be a json array each item of which
     is a dictionary of the form ``{"p": 3, "c": 5}`` where ``"p"`` indicates the
     predict label, while "c" indicates the correct label. If you use libsvm,
-    ``create_label_result_libsvm`` converts the results to this format.
+    ``create_label_result_libsvm`` converts the results to this format. A NumPy
+    array written by ``create_label_result_libsvm`` to a ``.npy`` node is also
+    accepted; it is memory-mapped instead of being parsed.
 
     The output measures is summarized as follows, most of which are cited from (*):
 
@@ -254,83 +461,55 @@ def calculate_stats_multiclass_classification(task):
     Information Processing and Management 45 (2009) 427-437
 
     """
-    class labelstat(object):
-        def __init__(self):
-            self.tp = 0  # true positive
-            self.tn = 0  # true negative
-            self.fp = 0  # false positive
-            self.fn = 0  # false negative
-
-        def add_count(self, is_predict_label, is_collect_label):
-            if is_predict_label and is_collect_label: self.tp += 1
-            elif is_predict_label and not is_collect_label: self.fp += 1
-            elif not is_predict_label and is_collect_label: self.fn += 1
-            else: self.tn += 1
-
-        def accuracy(self): return float(self.tp + self.tn) / self.sum()
-        def error_rate(self): return float(self.fp + self.fn) / self.sum()
-
-        def precision_numer(self): return self.tp
-        def precision_denom(self): return self.tp + self.fp
-        def recall_numer(self): return self.tp
-        def recall_denom(self): return self.tp + self.fn
-
-        def precision(self):
-            if self.precision_denom() == 0: return 1.0
-            else: return float(self.precision_numer()) / self.precision_denom()
-        def recall(self):
-            if self.recall_denom() == 0: return 1.0
-            else: return float(self.recall_numer()) / self.recall_denom()
-
-        def specifity(self):
-            if self.fp + self.tn == 0: return 1.0
-            else: return float(self.tn) / (self.fp + self.tn)
-        def AUC(self):
-            a = 1.0 if self.tp == 0 else float(self.tp) / (self.tp + self.fn)
-            b = 1.0 if self.tn == 0 else float(self.tn) / (self.tn + self.fp)
-            return 0.5 * (a + b)
-        def sum(self): return self.tp + self.fn + self.fp + self.tn
-        def num_instance(self): return self.tp + self.fn
-
     def F1(prec, recall):
         if prec * recall == 0: return 0
         else: return 2 * prec * recall / (prec + recall)
 
-    predict_correct_labels = json.loads(task.inputs[0].read())
-    labelset = set([e["p"] for e in predict_correct_labels] \
-                       + [e["c"] for e in predict_correct_labels])
-
-    labelstats = collections.defaultdict(labelstat)
-    for e in predict_correct_labels:
-        p, c = e["p"], e["c"]
-        for label in labelset:
-            labelstats[label].add_count(p == label, c == label)
+    predicts, corrects = _load_label_result(task.inputs[0])
+    labels, codes = _encode_labels(predicts, corrects)
+    num_labels = len(labels)
+    num_instances = len(predicts)
+
+    # confusion[c, p] is the number of instances of correct label c predicted
+    # as label p.
+    confusion = numpy.bincount(
+        codes[num_instances:] * num_labels + codes[:num_instances],
+        minlength=num_labels * num_labels).reshape(num_labels, num_labels)
+    tp = numpy.diag(confusion)
+    fp = confusion.sum(axis=0) - tp
+    fn = confusion.sum(axis=1) - tp
+    tn = num_instances - tp - fp - fn
+
+    precisions = _ratio_or_one(tp, tp + fp)
+    recalls = _ratio_or_one(tp, tp + fn)
+    specifities = _ratio_or_one(tn, fp + tn)
+    aucs = 0.5 * (numpy.where(tp == 0, 1.0, _ratio_or_one(tp, tp + fn)) +
+                  numpy.where(tn == 0, 1.0, _ratio_or_one(tn, tn + fp)))
 
     def _macro_average(values):
         return float(sum(values)) / len(values)
 
     results = {}
-    results["accuracy"] = \
-        float(sum([s.tp for s in labelstats.values()])) / labelstats.values()[0].sum()
-    results["average_accuracy"] = _macro_average([s.accuracy() for s in labelstats.values()])
-    results["error_rate"] = _macro_average([s.error_rate() for s in labelstats.values()])
-
-    for label, s in labelstats.items():
-        prec = results["%s-precision" % label] = s.precision()
-        recall = results["%s-recall" % label] = s.recall()
+    results["accuracy"] = float(tp.sum()) / num_instances
+    results["average_accuracy"] = _macro_average(
+        ((tp + tn) / float(num_instances)).tolist())
+    results["error_rate"] = _macro_average(
+        ((fp + fn) / float(num_instances)).tolist())
+
+    for label, prec, recall, specifity, auc in zip(
+            labels, precisions.tolist(), recalls.tolist(),
+            specifities.tolist(), aucs.tolist()):
+        results["%s-precision" % label] = prec
+        results["%s-recall" % label] = recall
         results["%s-F1" % label] = F1(prec, recall)
-        results["%s-specifity" % label] = s.specifity()
-        results["%s-AUC" % label] = s.AUC()
-    results["precision-macro"] = _macro_average([v for (k, v) in results.items() \
-                                                     if k.endswith("precision")])
-    results["precision-micro"] = float(sum([v.precision_numer() for v in labelstats.values()])) \
-                               / sum([v.precision_denom() for v in labelstats.values()])
-    results["precision-micro-numer"] = sum([v.precision_numer() for v in labelstats.values()])
-    results["precision-micro-denom"] = sum([v.precision_denom() for v in labelstats.values()])
-    results["recall-macro"] = _macro_average([v for (k, v) in results.items() \
-                                                  if k.endswith("recall")])
-    results["recall-micro"] = float(sum([v.recall_numer() for v in labelstats.values()])) \
-                            / sum([v.recall_denom() for v in labelstats.values()])
+        results["%s-specifity" % label] = specifity
+        results["%s-AUC" % label] = auc
+    results["precision-macro"] = _macro_average(precisions.tolist())
+    results["precision-micro"] = float(tp.sum()) / (tp + fp).sum()
+    results["precision-micro-numer"] = int(tp.sum())
+    results["precision-micro-denom"] = int((tp + fp).sum())
+    results["recall-macro"] = _macro_average(recalls.tolist())
+    results["recall-micro"] = float(tp.sum()) / (tp + fn).sum()
     results["F1-macro"] = F1(results["precision-macro"], results["recall-macro"])
     results["F1-micro"] = F1(results["precision-micro"], results["recall-micro"])
 
@@ -388,6 +567,91 @@ def segment_by_line(num_folds, parameter_name='fold'):
         source.close()
     return body
 
+def segment_all_folds_by_line(num_folds):
+    """Creates a rule that splits a line-by-line dataset to the train and
+    validation subsets of all folds at once.
+
+    This rule makes the same subsets as :py:func:`segment_by_line` for all
+    fold indices in one task, while :py:func:`segment_by_line` reads the whole
+    dataset twice in each of the tasks for fold indices. The output node is a
+    directory that contains ``<n>/train`` and ``<n>/test`` for each fold index
+    ``n``. Use :py:func:`select_fold` to make the usual train and validation
+    nodes with the fold parameter from this directory as follows.
+
+    .. code-block:: py
+
+        exp(source='data', target='folds',
+            rule=segment_all_folds_by_line(10))
+        exp(source='folds', target='train test',
+            parameters=[{'fold': i} for i in range(10)],
+            rule=select_fold())
+
+    The input is read twice in total: once to count the lines and once to copy
+    contiguous blocks of lines to the output files.
+
+    :param num_folds: Number of folds for splitting.
+    :type num_folds: ``int``
+    :return: A rule.
+    :rtype: :py:class:`maflib.core.Rule`
+
+    """
+    def body(task):
+        source_path = task.inputs[0].abspath()
+        num_lines = _count_lines(source_path)
+
+        # Output files are always created newly, since they may be hard-linked
+        # by select_fold.
+        output_path = task.outputs[0].abspath()
+        if os.path.exists(output_path):
+            shutil.rmtree(output_path)
+
+        trains, tests = [], []
+        try:
+            for n in range(num_folds):
+                os.makedirs(os.path.join(output_path, str(n)))
+                trains.append(open(os.path.join(output_path, str(n), 'train'), 'w'))
+                tests.append(open(os.path.join(output_path, str(n), 'test'), 'w'))
+
+            # The n-th fold is the lines [base * n, base * (n + 1)), and the
+            # remaining lines are contained in all training sets.
+            base = num_lines / num_folds
+            segments = [(base * (n + 1), [tests[n]] + trains[:n] + trains[n + 1:])
+                        for n in range(num_folds)]
+            segments.append((num_lines, trains))
+            with open(source_path) as source:
+                _copy_lines_by_segments(source, segments)
+        finally:
+            for f in trains + tests:
+                f.close()
+
+    return maflib.core.Rule(
+        fun=body, dependson=[segment_all_folds_by_line, num_folds])
+
+
+def select_fold(parameter_name='fold'):
+    """Creates a rule that selects the train and validation subsets of a fold
+    from the output of :py:func:`segment_all_folds_by_line`.
+
+    The outputs are the train and validation subsets of the fold whose index is
+    specified by the parameter ``parameter_name``. They are hard links to the
+    files in the input directory if possible, so no data is copied.
+
+    :param parameter_name: Name of the parameter indicating the index of the
+        fold.
+    :type parameter_name: ``str``
+    :return: A rule.
+    :rtype: :py:class:`maflib.core.Rule`
+
+    """
+    def body(task):
+        fold = os.path.join(task.inputs[0].abspath(),
+                            str(int(task.env[parameter_name])))
+        _link_or_copy(os.path.join(fold, 'train'), task.outputs[0].abspath())
+        _link_or_copy(os.path.join(fold, 'test'), task.outputs[1].abspath())
+
+    return maflib.core.Rule(fun=body, dependson=[select_fold, parameter_name])
+
+
 def segment_without_label_bias(weights, extract_label=(lambda line: line[:line.find(' ')])):
     """Segments an example per line data into k-fold where k is the length of param weights.
 
@@ -416,7 +680,7 @@ def segment_without_label_bias(weights, extract_label=(lambda line: line[:line.f
 
     """
 
-    def _segment_data_with_weights(data):
+    def _segment_endpoints(num_examples):
         normalized = map(lambda w: w / sum(weights), weights)
         accumulate = []
         a = 0
@@ -424,43 +688,601 @@ def segment_without_label_bias(weights, extract_label=(lambda line: line[:line.f
             a += n
             accumulate.append(a)
         accumulate[len(accumulate) - 1] = 1.0
-        endpoints = [0] + map(lambda w: int(len(data) * w), accumulate)
-        return [data[endpoints[i]:endpoints[i + 1]] for i in range(len(endpoints) - 1)]
+        return [0] + map(lambda w: int(num_examples * w), accumulate)
 
     def body(task):
         if len(weights) != len(task.outputs):
             raise maflib.core.InvalidMafArgumentException("lengths of weights must be the same as the number of target")
 
-        label2examples = collections.defaultdict(list)
-        for line in open(task.inputs[0].abspath()): label2examples[extract_label(line)].append(line)
-        label2segmented_examples = dict([(k, _segment_data_with_weights(v)) \
-                                   for k, v in label2examples.items()])
-        for i, o in enumerate(task.outputs):
-            with open(o.abspath(), 'w') as f:
-                for examples in label2segmented_examples.values():
-                    for line in examples[i]: f.write(line)
+        # The first pass counts examples of each label, and the second pass
+        # writes the j-th example of a label to the i-th output such that
+        # endpoints[i] <= j < endpoints[i + 1].
+        label2count = collections.defaultdict(int)
+        with open(task.inputs[0].abspath()) as f:
+            for line in f: label2count[extract_label(line)] += 1
+        label2endpoints = dict([(k, _segment_endpoints(v)) \
+                                for k, v in label2count.items()])
+        label2index = collections.defaultdict(int)
+
+        outputs = [open(o.abspath(), 'w') for o in task.outputs]
+        try:
+            with open(task.inputs[0].abspath()) as f:
+                for line in f:
+                    label = extract_label(line)
+                    endpoints = label2endpoints[label]
+                    index = label2index[label]
+                    label2index[label] = index + 1
+                    i = bisect.bisect_right(endpoints, index) - 1
+                    outputs[i].write(line)
+        finally:
+            for o in outputs: o.close()
         return 0
     return maflib.core.Rule(body, dependson=[segment_without_label_bias])
 
-def _decompress(srcpath, dstpath, filetype):
+_COPY_BLOCK_SIZE = 1 << 20
+
+
+def _download_cache_dir(cache_dir):
+    if cache_dir is not None:
+        return cache_dir
+    option = getattr(waflib.Options.options, 'download_cache', None)
+    if option is not None:
+        return option
+    return os.environ.get('MAF_DOWNLOAD_CACHE', '')
+
+
+def _download_without_cache(url, output, decompress_as):
+    # zip archive cannot be decompressed while downloading, since its
+    # directory is placed at the end of the file.
+    if decompress_as in _DECOMPRESSORS and decompress_as != 'zip':
+        response = urllib.urlopen(url)
+        try:
+            with open(output, 'wb') as dst:
+                _decompress_stream(response, dst, decompress_as)
+        finally:
+            response.close()
+    elif decompress_as != '':
+        t = tempfile.NamedTemporaryFile()
+        urllib.urlretrieve(url, t.name)
+        _materialize(t.name, output, decompress_as)
+    else:
+        urllib.urlretrieve(url, output)
+
+
+def _download_resumable(url, path, conditions=None):
+    # Downloads the URL to path, resuming from the existing content of path if
+    # the validator of the first response is saved in path + '.validator'.
+    # Returns the SHA-256 hex digest of the whole content, whether its size is
+    # verified by the Content-Length (or Content-Range) header, and the
+    # validator. Raises IOError if the size does not match, keeping the partial
+    # file to resume. Headers in conditions are added to the request, and
+    # urllib2.HTTPError is raised if the server answers 304 Not Modified.
+    validator_path = path + '.validator'
+    digest = hashlib.sha256()
+    offset = 0
+    validator = None
+    if os.path.exists(path) and os.path.exists(validator_path):
+        with open(validator_path) as f:
+            validator = f.read().strip()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_COPY_BLOCK_SIZE), ''):
+                digest.update(block)
+                offset += len(block)
+
+    conditions = conditions or {}
+    request = urllib2.Request(url, headers=conditions)
+    if offset:
+        request.add_header('Range', 'bytes=%d-' % offset)
+        request.add_header('If-Range', validator)
+    try:
+        response = urllib2.urlopen(request)
+    except urllib2.HTTPError as e:
+        if not offset or e.code != 416:
+            raise
+        # the partial file may be complete or broken; download it again
+        response = urllib2.urlopen(urllib2.Request(url, headers=conditions))
+        offset = 0
+    try:
+        headers = response.info()
+        if offset and response.getcode() != 206:
+            offset = 0  # the server ignored the range, or the file is changed
+        if not offset:
+            digest = hashlib.sha256()
+            validator = headers.getheader('ETag') or \
+                headers.getheader('Last-Modified')
+            if validator:
+                with open(validator_path, 'w') as f:
+                    f.write(validator)
+            else:
+                _remove_if_exists(validator_path)
+        total = _expected_size(headers, offset)
+
+        size = offset
+        with open(path, 'ab' if offset else 'wb') as f:
+            for block in iter(lambda: response.read(_COPY_BLOCK_SIZE), ''):
+                digest.update(block)
+                f.write(block)
+                size += len(block)
+    finally:
+        response.close()
+
+    if total is not None and size != total:
+        if size > total:
+            os.remove(path)
+        raise IOError(
+            "Downloaded %d bytes of %s, but %d bytes are expected." %
+            (size, url, total))
+    return digest.hexdigest(), total is not None, validator
+
+
+def _expected_size(headers, offset):
+    # Returns the size of the whole content given by the response headers, or
+    # None if it is unknown.
+    content_range = headers.getheader('Content-Range')
+    if offset and content_range:
+        total = content_range.rpartition('/')[2].strip()
+        if total.isdigit():
+            return int(total)
+    length = headers.getheader('Content-Length')
+    if length and length.strip().isdigit():
+        return offset + int(length)
+    return None
+
+
+def _remove_if_exists(path):
+    try:
+        os.remove(path)
+    except OSError:
+        if os.path.exists(path):
+            raise
+
+
+def _materialize(cached, output, decompress_as):
+    if decompress_as == '':
+        _clone_file(cached, output)
+    elif not _decompress(cached, output, decompress_as):
+        raise Exception(
+            "Filetype %s is not supported in download." % decompress_as)
+
+
+def _makedirs(path):
+    try:
+        os.makedirs(path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+
+
+def _count_lines(path):
+    # Counts lines in the same way as iterating the file object, i.e. the last
+    # line without a newline is also counted.
+    num_lines = 0
+    last = '\n'
+    with open(path) as f:
+        for block in iter(lambda: f.read(_COPY_BLOCK_SIZE), ''):
+            num_lines += block.count('\n')
+            last = block[-1]
+    if last != '\n':
+        num_lines += 1
+    return num_lines
+
+
+def _copy_lines_by_segments(source, segments):
+    # Copies lines of source to files. segments is a list of pairs of the end
+    # line number (exclusive) and files to which lines before it are written.
+    # Lines are copied by blocks, and lines are searched only around the ends.
+    line = 0
+    segments = iter(segments)
+    end, outputs = next(segments)
+    for block in iter(lambda: source.read(_COPY_BLOCK_SIZE), ''):
+        begin = 0
+        while True:
+            while line == end:
+                end, outputs = next(segments, (None, []))
+            if end is not None and line + block.count('\n', begin) >= end:
+                # the end of the current segment is in this block
+                pos = begin
+                while line < end:
+                    pos = block.index('\n', pos) + 1
+                    line += 1
+                piece = block[begin:pos]
+                begin = pos
+            else:
+                piece = block[begin:]
+                line += piece.count('\n')
+                begin = len(block)
+            for output in outputs:
+                output.write(piece)
+            if begin == len(block):
+                break
+
+
+def _link_or_copy(src, dst):
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+# FICLONE ioctl of Linux, which shares the blocks of two files on file systems
+# supporting copy-on-write (e.g. btrfs and xfs).
+_FICLONE = 0x40049409
+
+
+def _clone_file(src, dst):
+    # Creates dst as a writable copy of src, as a reflink if possible.
+    if os.path.lexists(dst):
+        os.remove(dst)
+    with nested(open(src, 'rb'), open(dst, 'wb')) as (src_file, dst_file):
+        try:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        except (IOError, OSError):
+            shutil.copyfileobj(src_file, dst_file, _COPY_BLOCK_SIZE)
+
+
+def _decompress(srcpath, dstpath, filetype, jobs=1):
+    if filetype == 'zip' and zipfile.is_zipfile(srcpath):
+        with contextlib.closing(zipfile.ZipFile(srcpath)) as archive:
+            members = [m for m in archive.infolist()
+                       if not m.filename.endswith('/')]
+            if len(members) != 1:
+                raise maflib.core.InvalidMafArgumentException(
+                    "zip archive %s must contain exactly one file." % srcpath)
+            with nested(contextlib.closing(archive.open(members[0])),
+                        open(dstpath, 'wb')) as (src, dst):
+                shutil.copyfileobj(src, dst, _COPY_BLOCK_SIZE)
+        return True
+
+    if filetype not in _DECOMPRESSORS:
+        return False
+
+    if jobs > 1 and _decompress_pool.pool.jobs() > 1:
+        chunks = _find_parallel_chunks(srcpath, filetype)
+        if chunks:
+            try:
+                with open(dstpath, 'wb') as dst:
+                    _decompress_parallel(srcpath, dst, filetype, chunks, jobs)
+                return True
+            except _IncompleteChunkError:
+                pass  # falls back to the sequential decompression
+
+    with nested(open(srcpath, 'rb'), open(dstpath, 'wb')) as (src, dst):
+        _decompress_stream(src, dst, filetype)
+    return True
+
+
+def _decompress_stream(src, dst, filetype):
+    # Decompresses the file object src into dst by blocks. Concatenated
+    # streams (e.g. multi-member gzip or bzip2 files) are decompressed one after
+    # another, and zero padding after the last stream is ignored. Raises
+    # IOError if the last stream is truncated.
+    new_decompressor = _DECOMPRESSORS[filetype]
+    decompressor = new_decompressor()
+    empty = True
+    for data in iter(lambda: src.read(_COPY_BLOCK_SIZE), ''):
+        empty = False
+        while data:
+            try:
+                dst.write(decompressor.decompress(data))
+            except EOFError:
+                # bz2 decompressor raises EOFError after the end of stream
+                decompressor = new_decompressor()
+                continue
+            data = decompressor.unused_data
+            if data:
+                if not data.strip('\0'):
+                    return decompressor
+                decompressor = new_decompressor()
+    if not empty and not _is_end_of_stream(decompressor):
+        raise IOError('compressed data ended before the end of stream')
+    if hasattr(decompressor, 'flush'):
+        dst.write(decompressor.flush())
+    return decompressor
+
+
+def _is_end_of_stream(decompressor):
+    if decompressor.unused_data:
+        return True
+    if hasattr(decompressor, 'eof'):
+        return decompressor.eof  # lzma
+    if hasattr(decompressor, 'copy'):
+        # zlib of Python 2 has no eof attribute, but leaves data after the end
+        # of stream (i.e. after the gzip trailer is checked) to unused_data.
+        probe = decompressor.copy()
+        try:
+            probe.decompress('\0')
+        except zlib.error:
+            return False
+        return probe.unused_data == '\0'
+    # bz2 decompressor of Python 2 raises EOFError after the end of stream
+    try:
+        decompressor.decompress('')
+    except EOFError:
+        return True
+    return False
+
+
+_PARALLEL_CHUNK_SIZE = 4 << 20
+
+_BZ2_STREAM_HEADER = re.compile(r'BZh[1-9]1AY&SY')
+
+
+class _IncompleteChunkError(Exception):
+    pass
+
+
+def _find_parallel_chunks(path, filetype):
+    # Returns a list of (offset, length) of pieces of the file that can be
+    # decompressed independently, or None if the file cannot be split. Small
+    # streams or blocks are merged into pieces of about _PARALLEL_CHUNK_SIZE.
     if filetype == 'bz2':
-        import bz2
-        f = bz2.BZ2File(srcpath)
-        decompressed_data = f.read()
-        f.close()
+        offsets = _find_bz2_streams(path)
     elif filetype == 'gz':
-        import gzip
-        with gzip.GzipFile(srcpath) as f:
-            decompressed_data = f.read()
-    elif filetype == 'zip':
-        import zlib
-        with open(srcpath) as f:
-            compressed_data = f.read()
-        decompressed_data = zlib.decompress(compressed_data)
+        offsets = _find_bgzf_blocks(path)
     else:
-        return False
+        return None
+    if not offsets or offsets[0] != 0 or len(offsets) < 2:
+        return None
+
+    size = os.path.getsize(path)
+    chunks = []
+    begin = 0
+    for offset in offsets[1:] + [size]:
+        if offset - begin >= _PARALLEL_CHUNK_SIZE or offset == size:
+            chunks.append((begin, offset - begin))
+            begin = offset
+    return chunks if len(chunks) > 1 else None
+
+
+def _find_bz2_streams(path):
+    # Each bzip2 stream starts at a byte boundary with the stream header
+    # followed by the magic of the first block. The pattern may appear in
+    # compressed data by chance; such a false boundary is detected by
+    # _decompress_chunk.
+    offsets = []
+    overlap = len('BZh91AY&SY') - 1
+    with open(path, 'rb') as f:
+        position = 0
+        tail = ''
+        for block in iter(lambda: f.read(_COPY_BLOCK_SIZE), ''):
+            data = tail + block
+            base = position - len(tail)
+            for m in _BZ2_STREAM_HEADER.finditer(data):
+                if base + m.start() not in offsets[-1:]:
+                    offsets.append(base + m.start())
+            tail = data[-overlap:]
+            position += len(block)
+    return offsets
+
+
+def _find_bgzf_blocks(path):
+    # BGZF block is a gzip member whose extra field 'BC' holds the block size
+    # minus one. Returns None if the file is not a BGZF file.
+    offsets = []
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        position = 0
+        while position < size:
+            f.seek(position)
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != '\x1f\x8b\x08\x04':
+                return None
+            xlen, = struct.unpack('<H', header[10:12])
+            extra = f.read(xlen)
+            block_size = None
+            i = 0
+            while i + 4 <= len(extra):
+                slen, = struct.unpack('<H', extra[i + 2:i + 4])
+                if extra[i:i + 2] == 'BC' and slen == 2:
+                    block_size, = struct.unpack('<H', extra[i + 4:i + 6])
+                i += 4 + slen
+            if block_size is None:
+                return None
+            offsets.append(position)
+            position += block_size + 1
+    return offsets
+
+
+def _decompress_parallel(path, dst, filetype, chunks, jobs):
+    # Decompresses chunks by the worker pool. Chunks are submitted by windows,
+    # so decompressed data waiting to be written is bounded.
+    window = jobs * 2
+    for i in range(0, len(chunks), window):
+        args = [(path, offset, length, filetype)
+                for offset, length in chunks[i:i + window]]
+        for data in _decompress_pool.map(args):
+            if data is None:
+                raise _IncompleteChunkError()
+            dst.write(data)
+
+
+def _decompress_chunk(path, offset, length, filetype):
+    # Returns the decompressed data of a chunk, or None if the chunk is not a
+    # complete stream.
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        src = cStringIO.StringIO(f.read(length))
+    dst = cStringIO.StringIO()
+    try:
+        _decompress_stream(src, dst, filetype)
+    except (IOError, zlib.error):
+        return None
+    return dst.getvalue()
+
+
+class _DecompressPool(object):
+    # Worker pool of parallel decompression. The chunk decompression is
+    # registered by the first rule using it, so that builds without the rule do
+    # not fork the workers.
+    def __init__(self):
+        self.pool = maflib.core.WorkerPool('jobs')
+        self._index = None
+
+    def register(self):
+        if self._index is None:
+            self._index = self.pool.register(_decompress_chunk)
+
+    def map(self, args_list):
+        self.register()
+        return self.pool.map(self._index, args_list)
+
+
+_decompress_pool = _DecompressPool()
+
+
+def _lzma_decompressor():
+    try:
+        import lzma
+    except ImportError:
+        try:
+            from backports import lzma
+        except ImportError:
+            raise Exception(
+                "lzma module is required to decompress xz or lzma files.")
+    return lzma.LZMADecompressor()
+
+
+_DECOMPRESSORS = {
+    'bz2': bz2.BZ2Decompressor,
+    'gz': lambda: zlib.decompressobj(16 + zlib.MAX_WBITS),
+    'xz': _lzma_decompressor,
+    'lzma': _lzma_decompressor,
+    'zip': zlib.decompressobj,
+}
+
+
+
+def _select_by(records, better):
+    # Returns the first record (merged with its parameter) that no following
+    # record is better than.
+    best = None
+    for value, param in records:
+        value = dict(value)
+        value.update(param)
+        if best is None or better(value, best):
+            best = value
+    if best is None:
+        return json.dumps({})
+    return best
+
+
+def _load_label_result(node):
+    # Returns the predicted and correct labels written by
+    # create_label_result_libsvm. NumPy arrays are memory-mapped.
+    path = node.abspath()
+    with open(path, 'rb') as f:
+        is_npy = f.read(len(numpy.lib.format.MAGIC_PREFIX)) == \
+            numpy.lib.format.MAGIC_PREFIX
+    if is_npy:
+        result = numpy.load(path, mmap_mode='r')
+        return result[:, 0], result[:, 1]
+
+    predict_correct_labels = json.loads(node.read())
+    return ([e["p"] for e in predict_correct_labels],
+            [e["c"] for e in predict_correct_labels])
+
+
+def _encode_labels(predicts, corrects):
+    # Returns the list of distinct labels and the array of their indices,
+    # where indices of predicts are followed by those of corrects.
+    if isinstance(predicts, numpy.ndarray):
+        values = numpy.concatenate([predicts, corrects])
+    else:
+        values = predicts + corrects
+    values_array = numpy.asarray(values)
+    if values_array.ndim == 1 and values_array.dtype.kind in 'iuf':
+        labels, codes = numpy.unique(values_array, return_inverse=True)
+        return labels.tolist(), codes
+    index = {}
+    codes = [index.setdefault(value, len(index)) for value in values]
+    return sorted(index, key=index.get), numpy.array(codes, dtype=int)
+
+
+def _ratio_or_one(numer, denom):
+    # Element-wise numer / denom, where the ratio is 1 if denom is zero.
+    return numpy.where(denom == 0, 1.0,
+                       numer / numpy.maximum(denom, 1).astype(float))
+
+
+_SUMMARIZE_CHUNK_SIZE = 4096
+
+
+def _summarize(records, stats):
+    # Computes the average (and other statistics) of each numeric column of
+    # the records merged with their parameters. Records are converted into
+    # two-dimensional arrays by chunks, and statistics of the chunks are merged
+    # by the pairwise update of mean and squared deviation.
+    def merge(value, param):
+        value = dict(value)
+        value.update(param)
+        return value
+
+    merged = itertools.starmap(merge, records)
+    scheme = None
+    keys = []
+    n = 0
+    for chunk in iter(
+            lambda: list(itertools.islice(merged, _SUMMARIZE_CHUNK_SIZE)), []):
+        if scheme is None:
+            scheme = chunk[0]
+            keys = list(scheme)
+            sums, means, m2s = [numpy.zeros(len(keys)) for i in range(3)]
+            mins = numpy.empty(len(keys))
+            mins.fill(numpy.inf)
+            maxs = -mins
+
+        valid_keys, a = _numeric_columns(chunk, keys)
+        if len(valid_keys) < len(keys):
+            index = [keys.index(k) for k in valid_keys]
+            sums, mins, maxs, means, m2s = [
+                x[index] for x in (sums, mins, maxs, means, m2s)]
+            keys = valid_keys
+
+        m = len(chunk)
+        chunk_means = a.mean(axis=0)
+        delta = chunk_means - means
+        m2s = m2s + ((a - chunk_means) ** 2).sum(axis=0) + \
+            delta ** 2 * n * m / float(n + m)
+        means = means + delta * m / float(n + m)
+        sums = sums + a.sum(axis=0)
+        mins = numpy.minimum(mins, a.min(axis=0))
+        maxs = numpy.maximum(maxs, a.max(axis=0))
+        n += m
+
+    if scheme is None:
+        return {}
+    columns = {'std': numpy.sqrt(m2s / n), 'min': mins, 'max': maxs}
+    for i, key in enumerate(keys):
+        scheme[key] = float(sums[i] / n)
+        for stat in stats:
+            if stat == 'count':
+                scheme['%s-count' % key] = n
+            else:
+                scheme['%s-%s' % (key, stat)] = float(columns[stat][i])
+    return scheme
 
-    with open(dstpath, 'w') as f:
-        f.write(decompressed_data)
 
-    return True
+def _numeric_columns(chunk, keys):
+    # Returns keys whose values are convertible by float() in all records of
+    # the chunk and an array of the values of shape (len(chunk), len(keys)).
+    # Conversion of whole chunk is tried first, and per-key conversion is used
+    # only if it fails, since numpy converts None to nan and accepts sequences.
+    try:
+        a = numpy.array([[v[k] for k in keys] for v in chunk], dtype=float)
+        if a.shape == (len(chunk), len(keys)) and not numpy.isnan(a).any():
+            return keys, a
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    valid_keys = []
+    columns = []
+    for key in keys:
+        try:
+            columns.append([float(v[key]) for v in chunk])
+        except (KeyError, TypeError, ValueError):
+            continue
+        valid_keys.append(key)
+    a = numpy.array(columns, dtype=float).reshape(len(valid_keys), len(chunk))
+    return valid_keys, a.T
@@ -126,15 +126,8 @@ def aggregator(callback_body):
     @functools.wraps(callback_body)
     @rule
     def callback(task):
-        values = []
-        for node, parameter in zip(task.inputs, task.source_parameters):
-            content = json.loads(node.read())
-            if not isinstance(content, list):
-                content = [content]
-            for element in content:
-                element.update(parameter)
-            values += content
-
+        values = load_values([node.abspath() for node in task.inputs],
+                             task.source_parameters)
         abspath = task.outputs[0].abspath()
         result = callback_body(values, abspath, task.parameter)
 
@@ -171,19 +164,110 @@ def json_aggregator(callback_body):
     @functools.wraps(callback_body)
     @aggregator
     def callback(values, abspath, parameter):
-        def to_jsonable(v):
-            try:
-                json.dumps(v)
-                return v
-            except:
-                return str(v)
-        param = dict([(k, to_jsonable(parameter[k])) for k in parameter])
-        vals = [dict([(k, to_jsonable(v[k])) for k in v]) for v in values]
+        param = _to_jsonable_dict(parameter)
+        vals = [_to_jsonable_dict(v) for v in values]
         result = callback_body(vals, abspath, param)
         return json.dumps(result)
     
     return callback
-    
+
+
+def stream_aggregator(callback_body):
+    """Creates an aggregator that passes the inputs as a lazy iterator.
+
+    This function is a streaming version of :py:func:`aggregator`. Instead of
+    the list of all JSON objects, ``callback_body`` receives an iterator of
+    ``(value, parameter)`` pairs, where ``value`` is a JSON object in an input
+    file and ``parameter`` is the parameter of that input file. Input files are
+    read one by one while the iterator is consumed, so the aggregation runs in
+    memory independent of the number of inputs as long as ``callback_body``
+    folds the records without storing them. Note that ``parameter`` is not
+    merged into ``value`` unlike :py:func:`aggregator`.
+
+    The output is written in the same way as :py:func:`aggregator`.
+
+    :param callback_body: A function or a callable object that takes three
+        arguments: ``records``, ``abspath``, and ``parameter``. ``records`` is
+        an iterator of ``(value, parameter)`` pairs explained above.
+        ``abspath`` and ``parameter`` are same as those of
+        :py:func:`aggregator`. This function should return str or None.
+    :type callback_body: ``function`` or callable object of signature
+        ``(iterator, str, parameter)``.
+    :return: An aggregator function that calls ``callback_body``.
+    :rtype: ``function``
+
+    """
+    @functools.wraps(callback_body)
+    @rule
+    def callback(task):
+        records = _iterate_records([node.abspath() for node in task.inputs],
+                                   task.source_parameters)
+        abspath = task.outputs[0].abspath()
+        result = callback_body(records, abspath, task.parameter)
+
+        if result is not None:
+            task.outputs[0].write(result)
+
+    return callback
+
+
+def json_stream_aggregator(callback_body):
+    """Creates a streaming aggregator that outputs the result into json.
+
+    This function is a streaming version of :py:func:`json_aggregator`. Values
+    and parameters of the records and the parameter of the task are converted
+    to json-serializable ones in the same way as :py:func:`json_aggregator`.
+
+    :param callback_body: A function or a callable object that takes the same
+        arguments as that of :py:func:`stream_aggregator`, but return an
+        object, which is going to be serialized to json. See
+        :py:mod:`maflib.rules.max` for example.
+    :type callback_body: ``function`` or callable object of signature
+        ``(iterator, str, parameter)``
+    :return: A streaming aggregator.
+    :rtype: ``function``
+
+    """
+    @functools.wraps(callback_body)
+    @stream_aggregator
+    def callback(records, abspath, parameter):
+        def convert(records):
+            # Values are loaded from json, so only parameters are converted.
+            # Records of the same input file share the parameter object.
+            last, converted = None, None
+            for v, p in records:
+                if p is not last:
+                    last, converted = p, _to_jsonable_dict(p)
+                yield v, converted
+
+        param = _to_jsonable_dict(parameter)
+        result = callback_body(convert(records), abspath, param)
+        return json.dumps(result)
+
+    return callback
+
+
+def load_values(paths, parameters):
+    """Loads input files of an aggregation task in the same way as
+    :py:func:`aggregator`.
+
+    Each file is a JSON object or a JSON array of objects, and the parameter of
+    the file is merged into each of its objects.
+
+    :param paths: Paths to the input files.
+    :type paths: ``list`` of ``str``
+    :param parameters: Parameters of the input files.
+    :type parameters: ``list`` of :py:class:`maflib.core.Parameter`
+    :return: All objects in the input files.
+    :rtype: ``list`` of ``dict``
+
+    """
+    values = []
+    for value, parameter in _iterate_records(paths, parameters):
+        value.update(parameter)
+        values.append(value)
+    return values
+
 
 def product(parameter):
     """Generates a direct product of given listed parameters.
@@ -275,6 +359,31 @@ def sample(num_samples, distribution):
 
     return sampled
 
+def _iterate_records(paths, parameters):
+    for path, parameter in zip(paths, parameters):
+        with open(path) as f:
+            content = json.load(f)
+        if not isinstance(content, list):
+            content = [content]
+        for element in content:
+            yield element, parameter
+
+
+_JSON_SCALAR_TYPES = frozenset([int, long, float, bool, unicode, type(None)])
+
+
+def _to_jsonable_dict(d):
+    def to_jsonable(v):
+        if type(v) in _JSON_SCALAR_TYPES:
+            return v
+        try:
+            json.dumps(v)
+            return v
+        except:
+            return str(v)
+    return dict([(k, to_jsonable(d[k])) for k in d])
+
+
 def set_random_seed(x):
     numpy.random.seed(x)
 
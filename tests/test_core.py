@@ -24,9 +24,25 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 from maflib.core import *
+from maflib.core import _join_parameters
+from maflib.core import _callable_key
+from maflib.core import _rule_runner
+from maflib.core import _rule_pool
+from maflib.core import _rule_digest
+import maflib.core
+import maflib.test
+import maflib.util
+import waflib.Build
+import waflib.ConfigSet
+import waflib.Context
+import waflib.Logs
+import imp
+import optparse
 import tempfile
 import os
+import sqlite3
 import shutil
+import subprocess
 import sys
 if sys.version_info < (2, 7):
     import unittest2 as unittest
@@ -35,6 +51,7 @@ else:
 import shutil
 
 from waflib.Node import Node
+import waflib.Options
 
 class TestParameter(unittest.TestCase):
     def test_empty_parameter_does_not_conflict(self):
@@ -88,6 +105,81 @@ class TestParameter(unittest.TestCase):
         self.assertFalse(Parameter(a=1, b=2, c=3) in d)
 
 
+class TestFrozenParameter(unittest.TestCase):
+    def test_equal_to_parameter(self):
+        p = Parameter(a=1, b=2)
+        q = FrozenParameter(a=1, b=2)
+        self.assertEqual(p, q)
+        self.assertEqual(hash(p), hash(q))
+
+    def test_dict_with_frozen_parameter_keys(self):
+        d = {}
+        d[FrozenParameter(a=1, b=2)] = 1
+        self.assertEqual(1, d[Parameter(a=1, b=2)])
+        self.assertFalse(Parameter(a=1) in d)
+
+    def test_immutable(self):
+        p = FrozenParameter(a=1)
+        with self.assertRaises(TypeError):
+            p['a'] = 2
+        with self.assertRaises(TypeError):
+            del p['a']
+        with self.assertRaises(TypeError):
+            p.update(b=2)
+        self.assertEqual({'a': 1}, p)
+
+    def test_intern(self):
+        p = FrozenParameter.intern(a=1, b=2)
+        q = FrozenParameter.intern({'b': 2, 'a': 1})
+        r = FrozenParameter.intern(Parameter(a=1, b=2))
+        self.assertIs(p, q)
+        self.assertIs(p, r)
+        self.assertIsNot(p, FrozenParameter.intern(a=1))
+
+    def test_copy(self):
+        p = FrozenParameter(a=1, b=(2, 3))
+        for q in [copy.deepcopy(p), pickle.loads(pickle.dumps(p, 2))]:
+            self.assertIsInstance(q, FrozenParameter)
+            self.assertEqual(p, q)
+            self.assertEqual(hash(p), hash(q))
+
+
+class TestJoinParameters(unittest.TestCase):
+    def test_no_relation(self):
+        self.assertEqual([[]], _join_parameters([]))
+
+    def test_empty_relation(self):
+        self.assertEqual([], _join_parameters([[Parameter(a=1)], []]))
+
+    def test_single_relation(self):
+        ps = [Parameter(a=1), Parameter(a=2)]
+        self.assertEqual([[p] for p in ps], _join_parameters([ps]))
+
+    def test_join_on_common_key(self):
+        xs = [Parameter(a=a, b=b) for a in range(3) for b in range(2)]
+        ys = [Parameter(a=a, c=c) for a in range(1, 4) for c in range(2)]
+        self._test_join([xs, ys])
+
+    def test_join_without_common_key(self):
+        xs = [Parameter(a=a) for a in range(3)]
+        ys = [Parameter(b=b) for b in range(2)]
+        self._test_join([xs, ys])
+
+    def test_join_heterogeneous_keys(self):
+        xs = [Parameter(a=1), Parameter(a=2, b=1), Parameter(b=2), Parameter()]
+        ys = [Parameter(a=1, b=1), Parameter(b=2, c=3), Parameter(c=3)]
+        zs = [Parameter(c=3), Parameter(a=2, c=4), Parameter()]
+        self._test_join([xs, ys, zs])
+
+    def _test_join(self, relations):
+        expect = [[]]
+        for relation in relations:
+            expect = [ps + [q] for ps in expect for q in relation
+                      if not any(p.conflict_with(q) for p in ps)]
+        actual = _join_parameters(relations)
+        self.assertEqual(sorted(expect), sorted(actual))
+
+
 class Setting(object):
     def __init__(self, a, b, c):
         self.a = a
@@ -122,14 +214,529 @@ class TestParameterIdGenerator(unittest.TestCase):
             id_generator.get_id(Parameter({"setting": Setting(0,1,2)}))
             id_generator.save()
         
-            table = pickle.load(open(pickle_path))
-        
+            db = sqlite3.connect(pickle_path)
+            table = [pickle.loads(str(row[0])) for row in db.execute(
+                'SELECT parameter FROM parameters ORDER BY id')]
+            db.close()
+
             self.assertEqual(1, len(table))
             self.assertEqual({"setting":Setting(0,1,2)}, table[0])
         finally:
             clean_environment()
 
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'table')
+        self.text_path = os.path.join(self.tmpdir, 'table.tsv')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_ids_are_consistent_over_executions(self):
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        self.assertEqual('0', id_generator.get_id(Parameter(a=1)))
+        self.assertEqual('1', id_generator.get_id(Parameter(a=2)))
+        self.assertEqual('0', id_generator.get_id(Parameter(a=1)))
+        id_generator.save()
+
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        self.assertEqual('2', id_generator.get_id(Parameter(a=3)))
+        self.assertEqual('1', id_generator.get_id(Parameter(a=2)))
+        self.assertEqual({'a': 1}, id_generator.get(0))
+        id_generator.save()
+
+        with open(self.text_path) as f:
+            lines = f.read().splitlines()
+        self.assertListEqual(
+            ["0\t{'a': 1}", "1\t{'a': 2}", "2\t{'a': 3}"], lines)
+
+    def test_equal_numbers_have_the_same_id(self):
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        self.assertEqual('0', id_generator.get_id(Parameter(C=1)))
+        id_generator.save()
+
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        self.assertEqual('0', id_generator.get_id(Parameter(C=1.0)))
+        self.assertEqual('1', id_generator.get_id(Parameter(C=1.5)))
+        id_generator.close()
+
+    def test_ids_are_independent_of_hash_seed(self):
+        script = '\n'.join([
+            'import sys',
+            'from maflib.core import Parameter, ParameterIdGenerator',
+            'g = ParameterIdGenerator(sys.argv[1], sys.argv[2])',
+            'print g.get_id(Parameter(name="abc", opt="xyz", seed=1)),',
+            'print g.get_id(Parameter(name="def", tags=("p", "q")))',
+            'g.save()'])
+        ids = []
+        for seed in ['1', '1', '2', '3']:
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path),
+                       PYTHONHASHSEED=seed)
+            ids.append(subprocess.check_output(
+                [sys.executable, '-c', script, self.path, self.text_path],
+                env=env).split())
+        self.assertListEqual([['0', '1']] * 4, ids)
+        with open(self.text_path) as f:
+            self.assertEqual(2, len(f.read().splitlines()))
+
+    def test_convert_hash_column(self):
+        db = sqlite3.connect(self.path)
+        db.execute('CREATE TABLE parameters '
+                   '(id INTEGER PRIMARY KEY, hash INTEGER, parameter BLOB)')
+        with db:
+            db.execute('INSERT INTO parameters VALUES (0, 12345, ?)',
+                       (sqlite3.Binary(pickle.dumps({'a': 1})),))
+        db.close()
+
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        self.assertEqual('0', id_generator.get_id(Parameter(a=1)))
+        self.assertEqual('1', id_generator.get_id(Parameter(a=2)))
+
+    def test_unsaved_ids_are_discarded(self):
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        id_generator.get_id(Parameter(a=1))
+        id_generator.save()
+        id_generator.get_id(Parameter(a=2))
+
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        self.assertEqual('1', id_generator.get_id(Parameter(a=3)))
+        with self.assertRaises(KeyError):
+            id_generator.get(2)
+
+    def test_convert_pickled_table(self):
+        with open(self.path, 'wb') as f:
+            pickle.dump([{'a': 1}, {'a': 2, 'b': 'x'}], f)
+
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        self.assertEqual('1', id_generator.get_id(Parameter(a=2, b='x')))
+        self.assertEqual('2', id_generator.get_id(Parameter(a=3)))
+        id_generator.save()
+
+        id_generator = ParameterIdGenerator(self.path, self.text_path)
+        self.assertEqual('0', id_generator.get_id(Parameter(a=1)))
+        self.assertEqual('2', id_generator.get_id(Parameter(a=3)))
+        self.assertTrue(os.path.exists(self.text_path))
+
             
+class TestExpandedGraphCache(unittest.TestCase):
+    class NodeLike:
+        def __init__(self, parent=None):
+            self.parent = parent
+
+        def relpath(self):
+            return '.'
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'cache')
+        self.table_path = os.path.join(self.tmpdir, 'table')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _call_objects(self, parameters):
+        wscript = self.NodeLike(self.NodeLike())
+        co = CallObject(source='a', target='b', parameters=parameters,
+                        wscript=wscript)
+        co.dependson = ['def f(task): pass']
+        return [co]
+
+    def _tasks(self):
+        return [[('a', 'b/0-b', [FrozenParameter()], FrozenParameter(x=1))]]
+
+    def test_load_saved_tasks(self):
+        cache = ExpandedGraphCache(self.path, self.table_path)
+        cache.save(self._call_objects([{'x': 1}]), self._tasks())
+
+        cache = ExpandedGraphCache(self.path, self.table_path)
+        self.assertEqual(
+            self._tasks(), cache.load(self._call_objects([{'x': 1}])))
+
+    def test_not_exist(self):
+        cache = ExpandedGraphCache(self.path, self.table_path)
+        self.assertIsNone(cache.load(self._call_objects([{'x': 1}])))
+
+    def test_invalidated_by_parameters(self):
+        cache = ExpandedGraphCache(self.path, self.table_path)
+        cache.save(self._call_objects([{'x': 1}]), self._tasks())
+        self.assertIsNone(cache.load(self._call_objects([{'x': 2}])))
+
+    def test_invalidated_by_id_table(self):
+        cache = ExpandedGraphCache(self.path, self.table_path)
+        cache.save(self._call_objects([{'x': 1}]), self._tasks())
+        with open(self.table_path, 'w') as f:
+            f.write('changed')
+        self.assertIsNone(cache.load(self._call_objects([{'x': 1}])))
+
+
+class TestSignatureCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'cache')
+        self.file_path = os.path.join(self.tmpdir, 'file')
+        self._rewrite_keeping_stat('abc')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, content):
+        with open(self.file_path, 'w') as f:
+            f.write(content)
+
+    def _rewrite_keeping_stat(self, content):
+        self._write(content)
+        os.utime(self.file_path, (1000000000, 1000000000))
+
+    def _saved_cache(self, trust_stat):
+        cache = SignatureCache(self.path, trust_stat)
+        cache.get(self.file_path)
+        cache.save()
+        return SignatureCache(self.path, trust_stat)
+
+    def test_signature(self):
+        cache = SignatureCache(self.path)
+        self.assertEqual(
+            waflib.Utils.h_file(self.file_path), cache.get(self.file_path))
+
+    def test_trust_stat(self):
+        old_sig = waflib.Utils.h_file(self.file_path)
+        cache = self._saved_cache(True)
+        self._rewrite_keeping_stat('xyz')
+        self.assertEqual(old_sig, cache.get(self.file_path))
+
+    def test_trust_stat_changed(self):
+        cache = self._saved_cache(True)
+        self._write('abcd')
+        self.assertEqual(
+            waflib.Utils.h_file(self.file_path), cache.get(self.file_path))
+
+    def test_prefetch(self):
+        paths = [os.path.join(self.tmpdir, 'file%d' % i) for i in range(8)]
+        for i, path in enumerate(paths):
+            with open(path, 'w') as f:
+                f.write(str(i))
+
+        cache = SignatureCache(self.path)
+        cache.prefetch(paths, 4)
+        for path in paths:
+            os.remove(path)  # signatures are computed already
+        for i, path in enumerate(paths):
+            self.assertEqual(waflib.Utils.md5(str(i)).digest(), cache.get(path))
+
+    def test_not_trust_stat(self):
+        cache = self._saved_cache(False)
+        self._rewrite_keeping_stat('xyz')
+        self.assertEqual(
+            waflib.Utils.h_file(self.file_path), cache.get(self.file_path))
+
+
+class TestBuildCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'cache')
+        os.makedirs(self.path)
+        self.file_path = os.path.join(self.tmpdir, 'file')
+        self.dir_path = os.path.join(self.tmpdir, 'dir')
+        with open(self.file_path, 'w') as f:
+            f.write('a' * 100)
+        os.makedirs(os.path.join(self.dir_path, 'sub'))
+        with open(os.path.join(self.dir_path, 'sub', 'b'), 'w') as f:
+            f.write('b')
+        self.warnings = []
+        self.warn = waflib.Logs.warn
+        waflib.Logs.warn = self.warnings.append
+
+    def tearDown(self):
+        waflib.Logs.warn = self.warn
+        shutil.rmtree(self.tmpdir)
+
+    def test_restore(self):
+        cache = BuildCache(self.path, 1 << 20)
+        cache.store('abc', [self.file_path, self.dir_path])
+        os.remove(self.file_path)
+        shutil.rmtree(self.dir_path)
+
+        self.assertTrue(cache.restore('abc', [self.file_path, self.dir_path]))
+        with open(self.file_path) as f:
+            self.assertEqual('a' * 100, f.read())
+        with open(os.path.join(self.dir_path, 'sub', 'b')) as f:
+            self.assertEqual('b', f.read())
+
+    def test_restore_missing_entry(self):
+        cache = BuildCache(self.path, 1 << 20)
+        self.assertFalse(cache.restore('abc', [self.file_path]))
+
+    def test_store_to_unwritable_cache(self):
+        shutil.rmtree(self.path)
+        with open(self.path, 'w') as f:
+            f.write('not a directory')
+        cache = BuildCache(self.path, 1 << 20)
+        cache.store('abc', [self.file_path])  # does not raise
+        self.assertEqual(1, len(self.warnings))
+        self.assertFalse(cache.restore('abc', [self.file_path]))
+
+    def test_store_missing_output(self):
+        cache = BuildCache(self.path, 1 << 20)
+        cache.store('abc', [self.file_path, os.path.join(self.tmpdir, 'none')])
+        self.assertEqual(1, len(self.warnings))
+        self.assertFalse(cache.restore('abc', [self.file_path]))
+        self.assertListEqual(['ab'], os.listdir(self.path))
+
+    def test_restore_broken_entry(self):
+        cache = BuildCache(self.path, 1 << 20)
+        cache.store('abc', [self.file_path])
+        os.remove(os.path.join(self.path, 'ab', 'abc', '0'))
+        self.assertFalse(cache.restore('abc', [self.file_path]))
+        self.assertEqual(1, len(self.warnings))
+
+    def test_evict_least_recently_used(self):
+        cache = BuildCache(self.path, 250)
+        for i, key in enumerate(['k1', 'k2', 'k3']):
+            cache.store(key, [self.file_path])
+            os.utime(os.path.join(self.path, key[:2], key), (i, i))
+        cache.restore('k1', [self.file_path])  # k1 is used recently
+
+        cache.evict()
+        self.assertTrue(cache.restore('k1', [self.file_path]))
+        self.assertFalse(cache.restore('k2', [self.file_path]))
+        self.assertTrue(cache.restore('k3', [self.file_path]))
+
+    def test_evict_only_after_store(self):
+        BuildCache(self.path, 1 << 20).store('k1', [self.file_path])
+        cache = BuildCache(self.path, 50)
+        cache.evict()
+        self.assertTrue(cache.restore('k1', [self.file_path]))
+
+        cache.store('k2', [self.file_path])
+        cache.evict()
+        self.assertFalse(cache.restore('k1', [self.file_path]))
+        self.assertFalse(cache.restore('k2', [self.file_path]))
+        with open(os.path.join(self.path, '.size')) as f:
+            self.assertEqual('0', f.read())
+
+    def test_evict_trusts_size_index(self):
+        cache = BuildCache(self.path, 150)
+        cache.store('k1', [self.file_path])
+        cache.evict()
+        with open(os.path.join(self.path, '.size'), 'w') as f:
+            f.write('0')
+        cache.store('k2', [self.file_path])
+        cache.evict()  # the index says 100 bytes
+        self.assertTrue(cache.restore('k1', [self.file_path]))
+        self.assertTrue(cache.restore('k2', [self.file_path]))
+
+    def test_rule_digest(self):
+        def make_rule(key):
+            return lambda task: task.outputs[0].write(key)
+
+        self.assertEqual(_rule_digest(make_rule('v')),
+                         _rule_digest(make_rule('v')))
+        self.assertNotEqual(_rule_digest(make_rule('v')),
+                            _rule_digest(make_rule('w')))
+
+    def test_rule_digest_of_unstable_value(self):
+        value = object()
+        self.assertIsNone(_rule_digest(lambda task: value))
+
+
+class TestRule(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_fingerprint_ignores_formatting(self):
+        f = self._load('f1', 'def f(task):\n    return task + 1\n')
+        g = self._load('f2', 'def f(task):  # comment\n\n    return (task+1)\n')
+        self.assertEqual(Rule(f).stred_dependson(), Rule(g).stred_dependson())
+
+    def test_fingerprint_tracks_constants(self):
+        f = self._load('f3', 'def f(task):\n    return task + 1\n')
+        g = self._load('f4', 'def f(task):\n    return task + 2\n')
+        self.assertNotEqual(
+            Rule(f).stred_dependson(), Rule(g).stred_dependson())
+
+    def test_stred_dependson(self):
+        f = self._load('f5', 'def f(task):\n    pass\n')
+        stred = Rule(f, dependson=[3]).stred_dependson()
+        self.assertEqual(2, len(stred))
+        self.assertEqual('3', stred[0])
+        self.assertEqual(32, len(stred[1]))
+
+    def test_default_dependson_is_not_shared(self):
+        Rule(len)
+        self.assertListEqual([min], Rule(min).dependson)
+
+    def test_callable_key_of_closures(self):
+        def make_rule(key):
+            def rule(task):
+                return task[key]
+            return rule
+
+        self.assertEqual(_callable_key(make_rule('v')),
+                         _callable_key(make_rule('v')))
+        self.assertNotEqual(_callable_key(make_rule('v')),
+                            _callable_key(make_rule('w')))
+
+    def test_callable_key_distinguishes_modules(self):
+        f = self._load('f6', 'def f(task):\n    return X\nX = 1\n')
+        g = self._load('f7', 'def f(task):\n    return X\nX = 2\n')
+        self.assertEqual(Rule(f).stred_dependson(), Rule(g).stred_dependson())
+        self.assertNotEqual(_callable_key(f), _callable_key(g))
+
+    def _load(self, name, source):
+        path = os.path.join(self.tmpdir, name + '.py')
+        with open(path, 'w') as f:
+            f.write(source)
+        return imp.load_source(name, path).f
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.options = waflib.Options.options
+        waflib.Options.options = optparse.Values({'rule_jobs': 2})
+        self.task = maflib.test.TestTask()
+        self.task.set_input(0, 'input')
+        self.task.outputs.setsize(1)
+        self.task.parameter = Parameter({'a': 1})
+        self.task.env.FOO = 'foo'
+
+    def tearDown(self):
+        waflib.Options.options = self.options
+        _rule_pool.close()
+
+    def test_signature_does_not_depend_on_process_pool(self):
+        def fun(task):
+            pass
+
+        self.assertEqual(
+            waflib.Utils.h_fun(_rule_runner(Rule(fun))),
+            waflib.Utils.h_fun(_rule_runner(Rule(fun, process_pool=True))))
+
+    def test_rule_in_process_pool(self):
+        def fun(task):
+            # closures can be run since they are referred by index
+            task.outputs[0].write('%s %s %s %d' % (
+                task.inputs[0].read(), task.parameter['a'], task.env.FOO,
+                os.getpid()))
+            return 3
+
+        self.assertEqual(3, _rule_runner(Rule(fun, process_pool=True))(self.task))
+        content, a, foo, pid = self.task.outputs[0].read().split()
+        self.assertEqual('input', content)
+        self.assertEqual('1', a)
+        self.assertEqual('foo', foo)
+        self.assertNotEqual(os.getpid(), int(pid))
+
+    def test_rule_without_process_pool(self):
+        def fun(task):
+            task.outputs[0].write(str(os.getpid()))
+
+        _rule_runner(Rule(fun))(self.task)
+        self.assertEqual(str(os.getpid()), self.task.outputs[0].read())
+
+    def test_rule_in_process_pool_with_one_job(self):
+        def fun(task):
+            task.outputs[0].write(str(os.getpid()))
+
+        waflib.Options.options = optparse.Values({'rule_jobs': 1, 'jobs': 1})
+        _rule_runner(Rule(fun, process_pool=True))(self.task)
+        self.assertEqual(str(os.getpid()), self.task.outputs[0].read())
+
+    def test_error_in_process_pool(self):
+        def fun(task):
+            raise ValueError('value error in worker')
+
+        try:
+            _rule_runner(Rule(fun, process_pool=True))(self.task)
+        except RuntimeError as e:
+            self.assertIn('value error in worker', str(e))
+        else:
+            self.fail('RuntimeError is not raised')
+
+    def test_function_registered_after_fork(self):
+        pool = WorkerPool('test_jobs')
+        self.addCleanup(pool.close)
+        first = pool.register(lambda x: x + 1)
+        self.assertEqual(2, pool.apply(first, 1))
+        second = pool.register(lambda x: x * 3)
+        self.assertEqual(6, pool.apply(second, 2))
+        self.assertEqual(3, pool.apply(first, 2))
+
+    def test_function_registered_after_start(self):
+        pool = WorkerPool('rule_jobs')
+        self.addCleanup(pool.close)
+        first = pool.register(lambda: os.getpid())
+        pool.start()
+        second = pool.register(lambda: os.getpid())
+        # workers are not forked again while tasks are running
+        self.assertEqual(os.getpid(), pool.apply(second))
+        self.assertEqual([os.getpid()], pool.map(second, [()]))
+        self.assertNotEqual(os.getpid(), pool.apply(first))
+
+
+class TestDirectoryManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.manifest_path = os.path.join(self.tmpdir, 'manifest')
+        self.dirpath = os.path.join(self.tmpdir, 'out')
+        os.makedirs(os.path.join(self.dirpath, 'sub'))
+        for name in ['a', 'sub/b', 'sub/c']:
+            with open(os.path.join(self.dirpath, name), 'w') as f:
+                f.write(name)
+        self.node = Node('', None).make_node(self.dirpath)
+        for name in ['a', 'sub/b', 'sub/c']:
+            self.node.make_node(name)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_check_existing_directory(self):
+        manifest = DirectoryManifest(self.manifest_path)
+        self.assertTrue(manifest.check(self.node))
+        manifest.save()
+        self.assertTrue(DirectoryManifest(self.manifest_path).check(self.node))
+
+    def test_check_deleted_file_in_subdirectory(self):
+        manifest = DirectoryManifest(self.manifest_path)
+        self.assertTrue(manifest.check(self.node))
+        manifest.save()
+        os.remove(os.path.join(self.dirpath, 'sub/c'))
+        self.assertFalse(DirectoryManifest(self.manifest_path).check(self.node))
+
+    def test_check_file_modified_in_place(self):
+        manifest = DirectoryManifest(self.manifest_path)
+        self.assertTrue(manifest.check(self.node))
+        manifest.save()
+        with open(os.path.join(self.dirpath, 'sub/b'), 'w') as f:
+            f.write('modified')
+        manifest = DirectoryManifest(self.manifest_path)
+        self.assertFalse(manifest.check(self.node))
+
+        # the modified directory is recorded after the build
+        manifest.save()
+        self.assertTrue(DirectoryManifest(self.manifest_path).check(self.node))
+
+    def test_check_file_added_to_subdirectory(self):
+        manifest = DirectoryManifest(self.manifest_path)
+        manifest.check(self.node)
+        manifest.save()
+        os.makedirs(os.path.join(self.dirpath, 'sub/new'))
+        self.assertFalse(DirectoryManifest(self.manifest_path).check(self.node))
+
+    def test_check_deleted_directory(self):
+        shutil.rmtree(self.dirpath)
+        self.assertFalse(DirectoryManifest(self.manifest_path).check(self.node))
+
+    def test_check_file(self):
+        manifest = DirectoryManifest(self.manifest_path)
+        self.assertTrue(manifest.check(self.node.make_node('a')))
+        os.remove(os.path.join(self.dirpath, 'a'))
+        self.assertFalse(
+            DirectoryManifest(self.manifest_path).check(self.node.make_node('a')))
+
+
 class TestCallObject(unittest.TestCase):
     def test_listize_source(self):
         self._test_listize('source')
@@ -159,6 +766,20 @@ class TestCallObject(unittest.TestCase):
         co2 = CallObject(source='a b c', target='d e', features='x', for_each='p q')
         self.assertEqual(co1, co2)
 
+    def test_parameter_keys(self):
+        co = CallObject(parameter_keys='C gamma')
+        self.assertListEqual(['C', 'gamma'], co.parameter_keys)
+
+    def test_parameter_keys_inferred_from_rule(self):
+        co = CallObject(
+            rule='train -c ${C} -g ${gamma} $${x} ${SRC} > ${TGT[0].abspath()}',
+            parameter_keys=True)
+        self.assertListEqual(['C', 'gamma'], co.parameter_keys)
+
+    def test_parameter_keys_not_inferred_from_function(self):
+        self.assertRaises(InvalidMafArgumentException, CallObject,
+                          rule=lambda task: None, parameter_keys=True)
+
     def _test_listize(self, key):
         queries = [('a ab c', ['a', 'ab', 'c'])]
         for query in queries:
@@ -168,6 +789,138 @@ class TestCallObject(unittest.TestCase):
                 self.assertIn(q, getattr(co, key))
 
 
+class _RecordedTaskGen(object):
+    def __init__(self, kw):
+        self.__dict__.update(kw)
+        self.env = waflib.ConfigSet.ConfigSet()
+
+
+class _TaskGenRecorder(waflib.Build.BuildContext):
+    # Records arguments of task generators instead of creating them.
+    def __call__(self, **kw):
+        taskgen = _RecordedTaskGen(kw)
+        self.task_gens.append(taskgen)
+        return taskgen
+
+
+class _ExpansionContext(ExperimentContext, _TaskGenRecorder):
+    # ExperimentContext expanding call objects without the build tree of waf.
+    variant_dir = None
+
+    def __init__(self, variant_dir):
+        self.variant_dir = variant_dir
+        self.cur_script = TestExpandedGraphCache.NodeLike(
+            TestExpandedGraphCache.NodeLike())
+        self._experiment_graph = ExperimentGraph()
+        self.task_gens = []
+
+    def expand(self):
+        self._process_call_objects()
+        return self.task_gens
+
+    def _find_physical_node(self, node):
+        return node
+
+
+class TestTaskExpansion(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.ctx = _ExpansionContext(self.tmpdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_parameter_keys(self):
+        self.ctx(source='x', target='y',
+                 parameters=maflib.util.product(
+                     {'C': [1, 10], 'fold': [0, 1, 2]}),
+                 parameter_keys=['C'],
+                 rule='train -c ${C} ${SRC} > ${TGT}')
+        task_gens = self.ctx.expand()
+        self.assertItemsEqual(
+            [{'C': 1}, {'C': 10}], [tg.parameter for tg in task_gens])
+
+    def test_parameter_keys_with_source_parameters(self):
+        self.ctx(target='x', parameters=maflib.util.product(
+                     {'fold': [0, 1, 2], 'seed': [0, 1]}),
+                 rule='split ${fold} ${seed} > ${TGT}')
+        self.ctx(source='x', target='y',
+                 parameters=maflib.util.product(
+                     {'C': [1, 10], 'gamma': [1, 2, 3]}),
+                 parameter_keys=True,
+                 rule='train -c ${C} ${SRC} > ${TGT}')
+        task_gens = self.ctx.expand()[6:]
+        # source parameters are kept to distinguish input nodes
+        self.assertEqual(12, len(task_gens))
+        self.assertItemsEqual(
+            [{'fold': f, 'seed': s, 'C': c}
+             for f in [0, 1, 2] for s in [0, 1] for c in [1, 10]],
+            [tg.parameter for tg in task_gens])
+
+    def test_duplicated_tasks_are_linked(self):
+        for target in ['y', 'z']:
+            self.ctx(source='x', target=target, parameters=[{'a': 1}],
+                     rule='cat ${SRC} > ${TGT}')
+        task_gens = self.ctx.expand()
+        self.assertEqual('cat ${SRC} > ${TGT}', task_gens[0].rule)
+        self.assertIs(maflib.core._link_outputs, task_gens[1].rule)
+        self.assertEqual(task_gens[0].target, task_gens[1].source)
+
+    def test_duplicated_tasks_of_function_rules_are_linked(self):
+        def make_rule(key):
+            return lambda task: task.outputs[0].write(key)
+
+        for target, key in [('y', 'v'), ('z', 'v'), ('w', 'u')]:
+            self.ctx(source='x', target=target, rule=make_rule(key))
+        task_gens = self.ctx.expand()
+        self.assertListEqual(
+            [False, True, False],
+            [tg.rule is maflib.core._link_outputs for tg in task_gens])
+
+    def test_same_rules_of_different_wscripts_are_linked(self):
+        source = 'def rule(task):\n    task.outputs[0].write(X)\nX = "v"\n'
+        rules = [self._load_wscript(name, source) for name in ['a', 'b']]
+        rules.append(self._load_wscript('c', source.replace('"v"', '"u"')))
+        for target, rule in zip(['y', 'z', 'w'], rules):
+            self.ctx(source='x', target=target, rule=rule, opts={'v': [1]})
+        task_gens = self.ctx.expand()
+        self.assertListEqual(
+            [False, True, False],
+            [tg.rule is maflib.core._link_outputs for tg in task_gens])
+
+    def test_classes_of_different_wscripts_are_not_same(self):
+        source = ('class Writer(object):\n    pass\n'
+                  'def rule(task):\n    task.outputs[0].write(Writer)\n')
+        for target, name in [('y', 'a'), ('z', 'b')]:
+            self.ctx(source='x', target=target,
+                     rule=self._load_wscript(name, source))
+        task_gens = self.ctx.expand()
+        self.assertIsNot(maflib.core._link_outputs, task_gens[1].rule)
+
+    def test_tasks_with_different_attributes_are_not_linked(self):
+        self.ctx(source='x', target='y', rule='cat ${SRC} > ${TGT}')
+        self.ctx(source='x', target='z', rule='cat ${SRC} > ${TGT}', cwd='/')
+        self.ctx(source='x', target='w', rule='cat ${SRC} > ${TGT}',
+                 env=waflib.ConfigSet.ConfigSet())
+        task_gens = self.ctx.expand()
+        self.assertEqual(
+            ['cat ${SRC} > ${TGT}'] * 3, [tg.rule for tg in task_gens])
+
+    def test_without_parameter_keys(self):
+        self.ctx(source='x', target='y',
+                 parameters=maflib.util.product(
+                     {'C': [1, 10], 'fold': [0, 1, 2]}),
+                 rule='train -c ${C} ${SRC} > ${TGT}')
+        self.assertEqual(6, len(self.ctx.expand()))
+
+
+    def _load_wscript(self, name, source):
+        path = os.path.join(self.tmpdir, name, 'wscript')
+        os.mkdir(os.path.dirname(path))
+        with open(path, 'w') as f:
+            f.write(source)
+        return waflib.Context.load_module(path).rule
+
 class TestExperimentGraph(unittest.TestCase):
     def test_empty_graph(self):
         g = ExperimentGraph()
@@ -294,6 +1047,20 @@ class TestUtility(unittest.TestCase):
         self._write_and_read(abspath)
         shutil.rmtree(".maflib_test_utility_tmp_dir_abs")
 
+    def test_atomic_create_file_by_concurrent_writers(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'file')
+            # e.g. two tasks running in threads of a waf process
+            with maflib.core._atomic_create_file(path) as f:
+                with maflib.core._atomic_create_file(path) as g:
+                    g.write('inner')
+                f.write('outer')
+            self.assertEqual('outer', self._read(path))
+            self.assertListEqual(['file'], os.listdir(tmpdir))
+        finally:
+            shutil.rmtree(tmpdir)
+
     def _write_and_read(self, path):
         import maflib.core
         with maflib.core._create_file(path) as f: f.write("aaa")
@@ -24,7 +24,15 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 from maflib.plot import *
+import maflib.plot
+import maflib.test
+import optparse
+import os
+import subprocess
 import sys
+import tempfile
+import threading
+import waflib.Options
 if sys.version_info < (2, 7):
     import unittest2 as unittest
 else:
@@ -120,3 +128,111 @@ class TestPlotData(unittest.TestCase):
             'p': ([1, 7], [2, 4], [50, 85]),
             'q': ([5, 3], [3, 5], [25, 10])
         }, data)
+
+    def test_get_data_2d_with_tuple_key(self):
+        pd = PlotData(self.inputs)
+        data = pd.get_data_2d('x', 'y', key=('k', 'z'))
+        self.assertDictEqual({
+            ('p', 50): ([1], [2]),
+            ('p', 85): ([7], [4]),
+            ('q', 10): ([3], [5]),
+            ('q', 25): ([5], [3])
+        }, data)
+
+    def test_get_data_with_large_integers(self):
+        inputs = [
+            {'x': 2 ** 60 + 1, 'y': 1, 'k': 2 ** 60 + 1},
+            {'x': 2 ** 60, 'y': 2, 'k': 2 ** 60},
+            {'x': 10 ** 400, 'y': 3, 'k': 1.0},
+        ]
+        pd = PlotData(inputs)
+        self.assertTupleEqual(
+            ([2 ** 60, 2 ** 60 + 1, 10 ** 400], [2, 1, 3]),
+            pd.get_data_2d('x', 'y'))
+        self.assertDictEqual(
+            {2 ** 60: [2], 2 ** 60 + 1: [1], 1.0: [3]},
+            pd.get_data_1d('y', key='k'))
+
+    def test_get_data_with_mixed_types(self):
+        inputs = [
+            {'x': 2, 'y': 'b', 'k': 'p'},
+            {'x': 1.5, 'y': 'a', 'k': 1},
+            {'x': 1, 'y': [0], 'k': 'p'},
+            {'x': 'c', 'y': None, 'k': [0]},
+            {'y': 1}
+        ]
+        pd = PlotData(inputs)
+        self.assertListEqual([1, 1.5, 2, 'c'], pd.get_data_1d('x'))
+        self.assertTupleEqual(
+            ([1, 1.5, 2, 'c'], [[0], 'a', 'b', None]),
+            pd.get_data_2d('x', 'y'))
+        self.assertDictEqual(
+            {'p': [1, 2], 1: [1.5]},
+            PlotData(inputs[:3]).get_data_1d('x', key='k'))
+        # unhashable key values cannot be used as keys of dictionary
+        self.assertRaises(TypeError, pd.get_data_1d, 'x', key='k')
+
+
+def _plot_points(figure, data, parameter):
+    axes = figure.add_subplot(111)
+    axes.plot(*data.get_data_2d('x', 'y'))
+    with open(parameter['pid_path'], 'w') as f:
+        f.write(str(os.getpid()))
+
+
+def _plot_nothing(figure, data, parameter):
+    raise ValueError('nothing to plot')
+
+
+class TestPlotBy(unittest.TestCase):
+    def setUp(self):
+        self.options = waflib.Options.options
+        self.pid_file = tempfile.NamedTemporaryFile()
+        self.task = maflib.test.TestTask()
+        self.task.set_input_by_json(0, [{'x': 1, 'y': 2}, {'x': 2, 'y': 4}])
+        self.task.set_input_by_json(1, {'x': 3})
+        self.task.source_parameters = [{'y': 3}, {'y': 6}]
+        self.task.parameter = {'pid_path': self.pid_file.name}
+
+    def tearDown(self):
+        waflib.Options.options = self.options
+        maflib.plot._plot_pool.close()
+        if os.path.exists(self._png_path()):
+            os.remove(self._png_path())
+
+    def _png_path(self):
+        # matplotlib appends the extension to the path without extension
+        return self.task.outputs[0].abspath() + '.png'
+
+    def _rendering_pid(self):
+        with open(self._png_path()) as f:
+            self.assertEqual('\x89PNG\r\n\x1a\n', f.read(8))
+        return int(self.pid_file.read())
+
+    def test_plot_by_in_process(self):
+        waflib.Options.options = optparse.Values({'plot_jobs': 1})
+        plot_by(_plot_points)(self.task)
+        self.assertEqual(os.getpid(), self._rendering_pid())
+
+    def test_plot_by_in_worker_process(self):
+        waflib.Options.options = optparse.Values({'plot_jobs': 2})
+        plot_by(_plot_points)(self.task)
+        self.assertNotEqual(os.getpid(), self._rendering_pid())
+
+    def test_plot_by_unpicklable_parameter_in_process(self):
+        waflib.Options.options = optparse.Values({'plot_jobs': 2})
+        self.task.parameter['lock'] = threading.Lock()
+        plot_by(_plot_points)(self.task)
+        self.assertEqual(os.getpid(), self._rendering_pid())
+
+    def test_plot_by_propagates_error_of_worker(self):
+        waflib.Options.options = optparse.Values({'plot_jobs': 2})
+        self.assertRaises(RuntimeError, plot_by(_plot_nothing), self.task)
+
+    def test_import_does_not_import_matplotlib(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        imported = subprocess.check_output(
+            [sys.executable, '-c',
+             'import sys, maflib.plot; print "matplotlib" in sys.modules'],
+            env=env)
+        self.assertEqual('False', imported.strip())
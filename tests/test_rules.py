@@ -1,6 +1,8 @@
 from maflib import rules
 #import maflib.rules
 import waflib.Node
+import waflib.Options
+import optparse
 import collections
 import sys
 if sys.version_info < (2, 7):
@@ -10,6 +12,19 @@ else:
 import json
 from maflib.test import TestTask
 import tempfile
+import numpy
+import os
+import shutil
+import BaseHTTPServer
+import hashlib
+import threading
+try:
+    import lzma as _lzma
+except ImportError:
+    try:
+        from backports import lzma as _lzma
+    except ImportError:
+        _lzma = None
 
 class TestAggregationTask(unittest.TestCase):
     def test_max(self):
@@ -38,6 +53,55 @@ class TestAggregationTask(unittest.TestCase):
         result = task.json_output(0)
         self.assertEqual(result, {"param1": 1, "key1": 5, "key2": 30})
 
+    def test_average(self):
+        task = TestTask()
+        task.source_parameters = [{"param1": 0}, {"param1": 1}]
+
+        task.set_input_by_json(0, {"key1": 10, "key2": "a"})
+        task.set_input_by_json(1, [{"key1": 5, "key2": "b"}, {"key1": 0}])
+
+        rules.average(task)
+
+        result = task.json_output(0)
+        self.assertEqual(result, {"param1": 2./3, "key1": 5., "key2": "a"})
+
+    def test_average_non_numeric_values(self):
+        task = TestTask()
+        task.source_parameters = [{}, {}, {}]
+
+        task.set_input_by_json(0, {"key1": 1, "key2": 1, "key3": 1})
+        task.set_input_by_json(1, {"key1": None, "key2": [1], "key3": "2"})
+        task.set_input_by_json(2, {"key1": 3, "key2": 3, "key3": 3})
+
+        rules.average(task)
+
+        result = task.json_output(0)
+        self.assertEqual(result, {"key1": 1, "key2": 1, "key3": 2.})
+
+    def test_summarize_over_chunks(self):
+        chunk_size = rules._SUMMARIZE_CHUNK_SIZE
+        rules._SUMMARIZE_CHUNK_SIZE = 2
+        try:
+            task = TestTask()
+            task.source_parameters = [{"param1": 0}]
+            task.set_input_by_json(0, [{"key1": x} for x in [2, 4, 4, 4, 5]])
+
+            rules.summarize().fun(task)
+        finally:
+            rules._SUMMARIZE_CHUNK_SIZE = chunk_size
+
+        result = task.json_output(0)
+        self.assertAlmostEqual(result.pop("key1-std"), 0.96 ** 0.5)
+        self.assertEqual(result, {
+            "param1": 0, "param1-min": 0, "param1-max": 0, "param1-std": 0,
+            "param1-count": 5, "key1": 19./5, "key1-min": 2, "key1-max": 5,
+            "key1-count": 5})
+
+    def test_summarize_unknown_statistic(self):
+        self.assertRaises(
+            rules.maflib.core.InvalidMafArgumentException,
+            rules.summarize, ['median'])
+
 
 class TestMulticlassEvaluation(unittest.TestCase):
     def label(self, (p, c)): return {"p":p, "c":c}
@@ -60,7 +124,106 @@ class TestMulticlassEvaluation(unittest.TestCase):
         self.assertEqual(result["recall-micro"], 3./4)
         self.assertEqual(result["precision-macro"], 3./4)
 
+    def test_string_labels(self):
+        task = TestTask()
+        task.set_input_by_json(0, map(self.label, [("a","a"),("b","a"),("c","c")]))
+
+        rules.calculate_stats_multiclass_classification(task)
+        result = task.json_output(0)
+
+        self.assertEqual(result["accuracy"], 2./3)
+        self.assertEqual(result["a-recall"], 1./2)
+        self.assertEqual(result["b-precision"], 0)
+        self.assertEqual(result["b-recall"], 1)
+        self.assertEqual(result["b-F1"], 0)
+        self.assertEqual(result["b-specifity"], 2./3)
+        self.assertEqual(result["c-AUC"], 1)
+        self.assertEqual(result["precision-micro-denom"], 3)
+
         
+class TestLabelResultLibsvm(unittest.TestCase):
+    def test_json_result(self):
+        task = self._create_task()
+        rules.create_label_result_libsvm(task)
+        self.assertEqual(task.json_output(0), [
+            {"p": 1, "c": 1}, {"p": 1, "c": 2}, {"p": 2, "c": 2},
+            {"p": 2, "c": 2}])
+
+    def test_npy_result(self):
+        task = self._create_task()
+        with tempfile.NamedTemporaryFile(suffix='.npy') as f:
+            task.outputs[0].abspath_ = f.name
+            rules.create_label_result_libsvm(task)
+            self.assertEqual(
+                numpy.load(f.name).tolist(), [[1, 1], [1, 2], [2, 2], [2, 2]])
+
+            stats_task = TestTask()
+            stats_task.inputs[0].abspath_ = f.name
+            rules.calculate_stats_multiclass_classification(stats_task)
+            result = stats_task.json_output(0)
+        self.assertEqual(result["accuracy"], 3./4)
+        self.assertEqual(result["2-recall"], 2./3)
+
+    def test_inconsistent_number_of_lines(self):
+        task = self._create_task()
+        task.set_input(0, "1\n1\n")
+        self.assertRaises(rules.maflib.core.InvalidMafArgumentException,
+                          rules.create_label_result_libsvm, task)
+
+    def _create_task(self):
+        task = TestTask()
+        task.set_input(0, "1\n1\n2\n2\n")
+        task.set_input(1, "1 1:0.5\n2 1:0.5\n2 2:1\n2 3:1\n")
+        return task
+
+
+class TestSegmentAllFoldsByLine(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.block_size = rules._COPY_BLOCK_SIZE
+        rules._COPY_BLOCK_SIZE = 7
+
+    def tearDown(self):
+        rules._COPY_BLOCK_SIZE = self.block_size
+        shutil.rmtree(self.tmpdir)
+
+    def test_same_as_segment_by_line(self):
+        for data in ["", "a\n", "a\nbb\nccc\ndddd\ne\n", "a\nbb\nccc\ndddd\ne",
+                     "".join("line %d\n" % i for i in range(23))]:
+            for num_folds in [1, 2, 3, 5, 7]:
+                self._check(data, num_folds)
+
+    def test_select_fold_links_files(self):
+        folds = self._segment_all("a\nb\nc\nd\n", 2)
+        task = TestTask()
+        task.inputs[0].abspath_ = folds
+        task.env['fold'] = '1'
+        rules.select_fold().fun(task)
+        self.assertEqual("a\nb\n", task.outputs[0].read())
+        self.assertEqual("c\nd\n", task.outputs[1].read())
+        self.assertTrue(os.path.samefile(
+            os.path.join(folds, '1', 'test'), task.outputs[1].abspath()))
+
+    def _check(self, data, num_folds):
+        folds = self._segment_all(data, num_folds)
+        for n in range(num_folds):
+            task = TestTask()
+            task.set_input(0, data)
+            task.env['fold'] = str(n)
+            rules.segment_by_line(num_folds)(task)
+            with open(os.path.join(folds, str(n), 'train')) as f:
+                self.assertEqual(task.outputs[0].read(), f.read())
+            with open(os.path.join(folds, str(n), 'test')) as f:
+                self.assertEqual(task.outputs[1].read(), f.read())
+
+    def _segment_all(self, data, num_folds):
+        task = TestTask()
+        task.set_input(0, data)
+        task.outputs[0].abspath_ = os.path.join(self.tmpdir, 'folds')
+        rules.segment_all_folds_by_line(num_folds).fun(task)
+        return task.outputs[0].abspath()
+
+
 class TestSegmentLibsvm(unittest.TestCase):
     weights = [0.8, 0.1, 0.1]
     labels = [0, 1]
@@ -111,3 +274,327 @@ class TestSegmentLibsvm(unittest.TestCase):
         two_label2count = self._count_num_labels(task.outputs[2])
         self.assertEqual(two_label2count[0], 2) # last fraction are collected to the last output
         self.assertEqual(two_label2count[1], 1)
+
+    def test_interleaved_labels(self):
+        # j-th example of each label goes to the output of its quota, and
+        # examples are written in the input order
+        data = [[l, j] for j in range(10) for l in self.labels]
+        task = self._process_task(data)
+
+        self.assertEqual(
+            [' '.join(map(str, e)) + '\n' for e in data if e[1] < 8],
+            list(open(task.outputs[0].abspath())))
+        self.assertEqual(['0 8\n', '1 8\n'], list(open(task.outputs[1].abspath())))
+        self.assertEqual(['0 9\n', '1 9\n'], list(open(task.outputs[2].abspath())))
+
+
+class TestDecompress(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.block_size = rules._COPY_BLOCK_SIZE
+        rules._COPY_BLOCK_SIZE = 5
+        self.content = ''.join('line %d\n' % i for i in range(100))
+        self.options = waflib.Options.options
+        waflib.Options.options = optparse.Values({'jobs': 2})
+
+    def tearDown(self):
+        rules._COPY_BLOCK_SIZE = self.block_size
+        waflib.Options.options = self.options
+        rules._decompress_pool.pool.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_bz2(self):
+        import bz2
+        self._check('bz2', bz2.compress(self.content))
+
+    def test_bz2_multiple_streams(self):
+        import bz2
+        half = len(self.content) / 2
+        self._check('bz2', bz2.compress(self.content[:half]) +
+                    bz2.compress(self.content[half:]))
+
+    def test_gz(self):
+        self._check('gz', self._gzip(self.content) + '\0' * 8)
+
+    def test_gz_multiple_members(self):
+        half = len(self.content) / 2
+        self._check('gz', self._gzip(self.content[:half]) +
+                    self._gzip(self.content[half:]))
+
+    def test_truncated_bz2(self):
+        import bz2
+        self._check_truncated('bz2', bz2.compress(self.content))
+
+    def test_truncated_gz(self):
+        self._check_truncated('gz', self._gzip(self.content))
+
+    def test_truncated_gz_trailer(self):
+        self._check_truncated('gz', self._gzip(self.content)[:-4])
+
+    @unittest.skipUnless(_lzma, 'lzma module is not available')
+    def test_truncated_xz(self):
+        self._check_truncated('xz', _lzma.compress(self.content))
+
+    def test_truncated_download(self):
+        import bz2
+        path = os.path.join(self.tmpdir, 'src.bz2')
+        with open(path, 'wb') as f:
+            f.write(bz2.compress(self.content)[:-10])
+        task = TestTask()
+        self.assertRaises(
+            IOError, rules.download('file://' + path, decompress_as='bz2',
+                                    cache_dir='').fun, task)
+
+    def test_zlib(self):
+        import zlib
+        self._check('zip', zlib.compress(self.content))
+
+    def test_zip_archive(self):
+        import zipfile
+        path = os.path.join(self.tmpdir, 'src.zip')
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('data.txt', self.content)
+        with open(path, 'rb') as f:
+            self._check('zip', f.read())
+
+    def test_auto(self):
+        import bz2
+        self._check('auto', bz2.compress(self.content), 'src.bz2')
+
+    def test_unsupported(self):
+        self.assertRaises(Exception, self._check, 'rar', '')
+
+    def test_download(self):
+        import bz2
+        path = os.path.join(self.tmpdir, 'src.bz2')
+        with open(path, 'wb') as f:
+            f.write(bz2.compress(self.content))
+        task = TestTask()
+        rules.download('file://' + path, decompress_as='bz2', cache_dir='').fun(task)
+        self.assertEqual(self.content, task.outputs[0].read())
+
+    def test_parallel_bz2(self):
+        import bz2
+        chunk_size = rules._PARALLEL_CHUNK_SIZE
+        rules._PARALLEL_CHUNK_SIZE = 1
+        try:
+            self._check('bz2', ''.join(
+                bz2.compress(self.content[i:i + 100])
+                for i in range(0, len(self.content), 100)), jobs=3)
+        finally:
+            rules._PARALLEL_CHUNK_SIZE = chunk_size
+
+    def test_parallel_bz2_false_boundary(self):
+        import bz2
+        find_bz2_streams = rules._find_bz2_streams
+        rules._find_bz2_streams = lambda path: [0, 50, 100]
+        chunk_size = rules._PARALLEL_CHUNK_SIZE
+        rules._PARALLEL_CHUNK_SIZE = 1
+        try:
+            self._check('bz2', bz2.compress(self.content), jobs=2)
+        finally:
+            rules._find_bz2_streams = find_bz2_streams
+            rules._PARALLEL_CHUNK_SIZE = chunk_size
+
+    def test_parallel_bgzf(self):
+        chunk_size = rules._PARALLEL_CHUNK_SIZE
+        rules._PARALLEL_CHUNK_SIZE = 1
+        try:
+            compressed = ''.join(
+                self._bgzf_block(self.content[i:i + 100])
+                for i in range(0, len(self.content), 100))
+            compressed += self._bgzf_block('')
+            path = os.path.join(self.tmpdir, 'src.gz')
+            with open(path, 'wb') as f:
+                f.write(compressed)
+            self.assertTrue(len(rules._find_bgzf_blocks(path)) > 1)
+            self._check('gz', compressed, jobs=2)
+        finally:
+            rules._PARALLEL_CHUNK_SIZE = chunk_size
+
+    def test_plain_gzip_is_not_bgzf(self):
+        path = os.path.join(self.tmpdir, 'src.gz')
+        with open(path, 'wb') as f:
+            f.write(self._gzip(self.content))
+        self.assertIsNone(rules._find_bgzf_blocks(path))
+
+    def _check(self, filetype, compressed, name='src', jobs=1):
+        task = TestTask()
+        task.inputs[0].abspath_ = os.path.join(self.tmpdir, name)
+        with open(task.inputs[0].abspath(), 'wb') as f:
+            f.write(compressed)
+        rules.decompress(filetype, jobs).fun(task)
+        self.assertEqual(self.content, task.outputs[0].read())
+
+    def _check_truncated(self, filetype, compressed):
+        self.assertRaises(IOError, self._check, filetype, compressed[:-10])
+
+    def _bgzf_block(self, data):
+        import struct
+        import zlib
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        deflated = compressor.compress(data) + compressor.flush()
+        header = '\x1f\x8b\x08\x04' + '\0' * 4 + '\0\xff' + struct.pack(
+            '<HccHH', 6, 'B', 'C', 2, 18 + len(deflated) + 8 - 1)
+        return header + deflated + struct.pack(
+            '<II', zlib.crc32(data) & 0xffffffff, len(data))
+
+    def _gzip(self, data):
+        import gzip
+        import StringIO
+        buf = StringIO.StringIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb') as f:
+            f.write(data)
+        return buf.getvalue()
+
+
+class _RangeRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    # Serves server.files with support of Range header.
+    def do_GET(self):
+        self.server.requests.append(self.headers.get('Range'))
+        content = self.server.files[self.path]
+        etag = '"%s"' % hashlib.md5(content).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        begin = 0
+        if self.headers.get('Range') and self.server.support_range and \
+           self.headers.get('If-Range') == etag:
+            begin = int(self.headers['Range'][len('bytes='):-1])
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (
+                begin, len(content) - 1, len(content)))
+        else:
+            self.send_response(200)
+        if self.server.send_length:
+            self.send_header('Content-Length', str(len(content) - begin))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(content[begin:len(content) - self.server.truncate])
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownloadCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmpdir, 'cache')
+        self.content = ''.join('line %d\n' % i for i in range(1000))
+        self.sha256 = hashlib.sha256(self.content).hexdigest()
+
+        self.server = BaseHTTPServer.HTTPServer(
+            ('127.0.0.1', 0), _RangeRequestHandler)
+        self.server.files = {'/data': self.content}
+        self.server.requests = []
+        self.server.support_range = True
+        self.server.send_length = True
+        self.server.truncate = 0
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.01})
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%d/data' % self.server.server_port
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.tmpdir)
+
+    def test_download_once(self):
+        for i in range(2):
+            output = self._download()
+            self.assertEqual(self.content, output.read())
+        self.assertEqual([None, None], self.server.requests)
+        objects = os.path.join(self.cache_dir, 'objects')
+        self.assertEqual([self.sha256], os.listdir(objects))
+        self.assertFalse(os.path.samefile(
+            os.path.join(objects, self.sha256), output.abspath()))
+        self.assertTrue(os.access(output.abspath(), os.W_OK))
+
+    def test_download_changed_file(self):
+        self._download()
+        self.content = 'new content\n'
+        self.server.files['/data'] = self.content
+        self.assertEqual(self.content, self._download().read())
+
+    def test_mapping_without_validator_is_not_trusted(self):
+        self._download()
+        key = hashlib.sha256(self.url).hexdigest()
+        with open(os.path.join(self.cache_dir, 'urls', key), 'w') as f:
+            f.write(self.sha256 + '\n')
+        self.content = 'new content\n'
+        self.server.files['/data'] = self.content
+        self.assertEqual(self.content, self._download().read())
+
+    def test_verify_sha256(self):
+        self.assertRaises(Exception, self._download, sha256='0' * 64)
+        self.assertEqual(self.content, self._download(sha256=self.sha256).read())
+
+    def test_cached_by_sha256(self):
+        self._download()
+        self.server.files['/other'] = self.content
+        self._download(url=self.url.replace('data', 'other'), sha256=self.sha256)
+        self.assertEqual([None], self.server.requests)
+
+    def test_resume(self):
+        self._write_partial(self.content[:100])
+        self.assertEqual(self.content, self._download().read())
+        self.assertEqual(['bytes=100-'], self.server.requests)
+
+    def test_resume_changed_file(self):
+        self._write_partial('old content', etag='"old"')
+        self.assertEqual(self.content, self._download().read())
+        self.assertEqual(['bytes=11-'], self.server.requests)
+
+    def test_resume_without_validator(self):
+        self._write_partial(self.content[:100], etag=None)
+        self.assertEqual(self.content, self._download().read())
+        self.assertEqual([None], self.server.requests)
+
+    def test_truncated_body(self):
+        self.server.truncate = 100
+        self.assertRaises(IOError, self._download)
+        self.assertEqual([], os.listdir(os.path.join(self.cache_dir, 'objects')))
+
+        self.server.truncate = 0
+        self.assertEqual(self.content, self._download().read())
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual('bytes=%d-' % (len(self.content) - 100),
+                         self.server.requests[1])
+
+    def test_unverified_size_is_not_mapped(self):
+        self.server.send_length = False
+        for i in range(2):
+            self.assertEqual(self.content, self._download().read())
+        self.assertEqual([None, None], self.server.requests)
+
+    def test_resume_not_supported(self):
+        self.server.support_range = False
+        self._write_partial(self.content[:100])
+        self.assertEqual(self.content, self._download().read())
+
+    def test_decompress(self):
+        import bz2
+        self.server.files['/data'] = bz2.compress(self.content)
+        self.assertEqual(self.content, self._download(decompress_as='bz2').read())
+
+    def _write_partial(self, data, etag=True):
+        os.makedirs(os.path.join(self.cache_dir, 'partial'))
+        key = hashlib.sha256(self.url).hexdigest()
+        path = os.path.join(self.cache_dir, 'partial', key)
+        with open(path, 'w') as f:
+            f.write(data)
+        if etag is True:
+            etag = '"%s"' % hashlib.md5(self.content).hexdigest()
+        if etag:
+            with open(path + '.validator', 'w') as f:
+                f.write(etag)
+
+    def _download(self, url=None, **kw):
+        task = TestTask()
+        rule = rules.download(url or self.url, cache_dir=self.cache_dir, **kw)
+        rule.fun(task)
+        return task.outputs[0]
+
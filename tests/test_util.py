@@ -25,12 +25,47 @@
 
 from maflib.util import *
 from maflib.core import Parameter
+from maflib.test import TestTask
+import types
 import sys
 if sys.version_info < (2, 7):
     import unittest2 as unittest
 else:
     import unittest
 
+class TestStreamAggregator(unittest.TestCase):
+    def test_records_are_lazy_pairs(self):
+        task = TestTask()
+        task.source_parameters = [{'p': 0}, {'p': 1}]
+        task.set_input_by_json(0, {'x': 1})
+        task.set_input_by_json(1, [{'x': 2}, {'x': 3}])
+
+        received = []
+        @stream_aggregator
+        def body(records, abspath, parameter):
+            self.assertIsInstance(records, types.GeneratorType)
+            received.extend(records)
+            return 'done'
+
+        body(task)
+        self.assertListEqual(
+            [({'x': 1}, {'p': 0}), ({'x': 2}, {'p': 1}), ({'x': 3}, {'p': 1})],
+            received)
+        self.assertEqual('done', task.outputs[0].read())
+
+    def test_json_stream_aggregator(self):
+        task = TestTask()
+        task.source_parameters = [{'p': object()}]
+        task.set_input_by_json(0, {'x': 1})
+
+        @json_stream_aggregator
+        def body(records, abspath, parameter):
+            return sum(v['x'] for v, p in records if isinstance(p['p'], str))
+
+        body(task)
+        self.assertEqual(1, task.json_output(0))
+
+
 class TestProduct(unittest.TestCase):
     def test_empty_input(self):
         self.assertEqual([{}], product({}))